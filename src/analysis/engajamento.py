@@ -7,10 +7,183 @@ e indicadores de engajamento a partir do dataset processado.
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict, Iterable, List, Optional
 
 import numpy as np
 import pandas as pd
+from pandas.api.typing import DataFrameGroupBy
+
+from src.data.preprocessing import (
+    INTERACTION_WEIGHTS,
+    WEIGHT_CATEGORIES,
+    WEIGHTS_BY_CODE,
+)
+
+
+def _timeline_vazia() -> pd.DataFrame:
+    """
+    Cria a timeline de um dataset sem interações.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame sem linhas com as colunas (e dtypes) de
+        ``timeline_engajamento``.
+    """
+
+    return pd.DataFrame(
+        {
+            "data_interacao": pd.Series(dtype="datetime64[ns]"),
+            "interacoes": pd.Series(dtype="int64"),
+            "score": pd.Series(dtype="int64"),
+        }
+    )
+
+
+def metricas_vazias() -> Dict[str, Any]:
+    """
+    Monta o conjunto de métricas de um dataset sem interações.
+
+    Quando não há interações, não faz sentido construir agrupamentos nem a
+    timeline: todas as tabelas saem vazias (com as mesmas colunas das
+    funções analíticas) e os KPIs zerados.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dicionário com as chaves "globais", "ranking", "categorias",
+        "timeline" e "distribuicao".
+    """
+
+    return {
+        "globais": {
+            "total_interacoes": 0,
+            "conteudos_analisados": 0,
+            "usuarios_participantes": 0,
+            "engajamento_medio_por_conteudo": 0.0,
+        },
+        "ranking": pd.DataFrame(
+            columns=["autor_id", "autor_nome", "score_engajamento"]
+        ),
+        "categorias": pd.DataFrame(columns=["categoria", "interacoes", "score"]),
+        "timeline": _timeline_vazia(),
+        "distribuicao": pd.DataFrame(
+            columns=["tipo_interacao", "quantidade", "percentual"]
+        ),
+    }
+
+
+def agrupar_por_autor(df: pd.DataFrame) -> DataFrameGroupBy:
+    """
+    Cria o agrupamento por autor usado no ranking de engajamento.
+
+    Os agrupamentos são construídos com ``sort=False`` (dispensa a ordenação
+    das chaves, pois os resultados são reordenados por score) e
+    ``observed=True`` (não materializa combinações vazias de categorias).
+    Construí-los fora das funções permite reaproveitá-los entre chamadas.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame processado contendo interações com informações de autor.
+
+    Returns
+    -------
+    DataFrameGroupBy
+        Agrupamento por ``autor_id`` (o nome depende apenas do id e é
+        recuperado depois, só para os autores do ranking).
+    """
+
+    return df.groupby("autor_id", sort=False, observed=True)
+
+
+def agrupar_por_categoria(df: pd.DataFrame) -> DataFrameGroupBy:
+    """
+    Cria o agrupamento por categoria de conteúdo.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame processado contendo interações com informações de categoria.
+
+    Returns
+    -------
+    DataFrameGroupBy
+        Agrupamento por ``categoria``.
+    """
+
+    return df.groupby("categoria", as_index=False, sort=False, observed=True)
+
+
+def _soma_pesos(df: pd.DataFrame) -> int:
+    """
+    Soma os pesos de interação de todas as linhas.
+
+    Com ``tipo_interacao`` categórica (como entregue pelo preprocessamento),
+    conta os códigos de cada tipo com ``np.bincount`` e multiplica pelo
+    vetor de pesos de cada categoria: uma passada inteira sobre os códigos,
+    sem ler a coluna peso_interacao. Com as categorias do preprocessamento
+    (mesma ordem de ``INTERACTION_WEIGHTS``), o vetor é o ``WEIGHTS_BY_CODE``
+    pré-calculado na importação. Nos demais casos soma a própria coluna.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame com colunas tipo_interacao e peso_interacao.
+
+    Returns
+    -------
+    int
+        Soma dos pesos (score total).
+    """
+
+    tipos = df["tipo_interacao"]
+    if isinstance(tipos.dtype, pd.CategoricalDtype) and not tipos.hasnans:
+        # Peso de cada categoria, na ordem dos códigos: o vetor pré-calculado
+        # quando as categorias são as do preprocessamento; caso contrário,
+        # montado a partir delas (tipos desconhecidos valem 0)
+        categorias = tipos.cat.categories
+        if tuple(categorias) == WEIGHT_CATEGORIES:
+            pesos_por_codigo = WEIGHTS_BY_CODE
+        else:
+            pesos_por_codigo = np.array(
+                [INTERACTION_WEIGHTS.get(tipo, 0) for tipo in categorias],
+                dtype=np.int64,
+            )
+        contagens = np.bincount(
+            tipos.cat.codes.to_numpy(), minlength=len(pesos_por_codigo)
+        )
+        return int(contagens @ pesos_por_codigo)
+
+    # O preprocessamento garante pesos sem nulos, então a redução do NumPy
+    # dispensa a máscara de NaN do pandas; o acumulador int64 evita overflow
+    # dos pesos armazenados em int8
+    return int(np.add.reduce(df["peso_interacao"].to_numpy(), dtype=np.int64))
+
+
+def _ids_distintos(serie: pd.Series) -> np.ndarray:
+    """
+    Retorna os ids distintos de uma coluna, ignorando valores ausentes.
+
+    ``pd.unique`` sobre o array NumPy faz uma única passada na hashtable,
+    mas, ao contrário de ``nunique``, conta ``<NA>`` como um valor; por isso
+    os nulos (possíveis nos ids inteiros Arrow da ingestão) são removidos
+    antes.
+
+    Parameters
+    ----------
+    serie : pd.Series
+        Coluna de identificadores.
+
+    Returns
+    -------
+    np.ndarray
+        Valores distintos, sem nulos.
+    """
+
+    if serie.hasnans:
+        serie = serie.dropna()
+    return pd.unique(serie.to_numpy())
 
 
 def global_engagement_metrics(df: pd.DataFrame) -> Dict[str, float]:
@@ -37,16 +210,16 @@ def global_engagement_metrics(df: pd.DataFrame) -> Dict[str, float]:
     """
 
     # Conta interações únicas (cada interacao_id representa uma interação)
-    total_interacoes = int(df["interacao_id"].nunique())
+    total_interacoes = len(_ids_distintos(df["interacao_id"]))
     
     # Conta conteúdos únicos que receberam interações
-    total_conteudos = int(df["conteudo_id"].nunique())
+    total_conteudos = len(_ids_distintos(df["conteudo_id"]))
     
     # Conta usuários únicos que realizaram interações
-    usuarios_participantes = int(df["usuario_id"].nunique())
+    usuarios_participantes = len(_ids_distintos(df["usuario_id"]))
 
     # Soma todos os pesos de interação para calcular score total
-    soma_pesos = float(df["peso_interacao"].sum())
+    soma_pesos = float(_soma_pesos(df))
     
     # Calcula engajamento médio: score total dividido pelo número de conteúdos
     # Evita divisão por zero retornando 0.0 se não houver conteúdos
@@ -60,7 +233,12 @@ def global_engagement_metrics(df: pd.DataFrame) -> Dict[str, float]:
     }
 
 
-def top_autores_por_engajamento(df: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
+def top_autores_por_engajamento(
+    df: pd.DataFrame,
+    top_n: int = 5,
+    *,
+    grupos: Optional[DataFrameGroupBy] = None,
+) -> pd.DataFrame:
     """
     Ranking simples de autores ordenado pelo score de engajamento.
     
@@ -73,6 +251,9 @@ def top_autores_por_engajamento(df: pd.DataFrame, top_n: int = 5) -> pd.DataFram
         DataFrame processado contendo interações com informações de autor.
     top_n : int, optional
         Número de autores a retornar no ranking. Por padrão é 5.
+    grupos : Optional[DataFrameGroupBy], optional
+        Agrupamento pré-construído por ``agrupar_por_autor``. Se None,
+        é criado a partir de ``df``.
     
     Returns
     -------
@@ -81,22 +262,83 @@ def top_autores_por_engajamento(df: pd.DataFrame, top_n: int = 5) -> pd.DataFram
         ordenado por score decrescente.
     """
 
-    # Agrupa por autor e soma os pesos de interação
-    ranking = (
-        df.groupby(["autor_id", "autor_nome"], as_index=False)["peso_interacao"]
-        .sum()
-        # Renomeia a coluna para um nome mais descritivo
-        .rename(columns={"peso_interacao": "score_engajamento"})
-        # Ordena do maior para o menor score
-        .sort_values(by="score_engajamento", ascending=False)
-        # Seleciona apenas os top N
-        .head(top_n)
-        .reset_index(drop=True)
+    if grupos is None:
+        grupos = agrupar_por_autor(df)
+
+    # Soma os pesos de interação por autor (chave inteira, hash barato)
+    # e seleciona os top N, com empates resolvidos pelo menor autor_id
+    top = _selecionar_top(grupos["peso_interacao"].sum(), top_n)
+
+    # Busca o nome apenas dos autores que entraram no ranking
+    nomes = (
+        df.loc[df["autor_id"].isin(top.index), ["autor_id", "autor_nome"]]
+        .drop_duplicates("autor_id")
+        .set_index("autor_id")["autor_nome"]
+    )
+
+    return _montar_ranking(top, nomes)
+
+
+def _selecionar_top(scores: pd.Series, top_n: int) -> pd.Series:
+    """
+    Seleciona os ``top_n`` autores de maior score sem ordenar todos eles.
+
+    O desempate pelo menor autor_id entra na própria seleção parcial
+    (``nlargest`` sobre score e autor_id negado), dispensando ordenar o
+    índice antes.
+
+    Parameters
+    ----------
+    scores : pd.Series
+        Score por autor, indexado por autor_id, em qualquer ordem.
+    top_n : int
+        Número de autores a retornar no ranking.
+
+    Returns
+    -------
+    pd.Series
+        Scores dos autores selecionados, em ordem decrescente.
+    """
+
+    candidatos = pd.DataFrame(
+        {
+            "score": scores.to_numpy(),
+            "autor_negado": -scores.index.to_numpy(dtype=np.int64),
+        }
     )
-    return ranking
+    posicoes = candidatos.nlargest(top_n, ["score", "autor_negado"]).index
+    return scores.iloc[posicoes]
 
 
-def interacoes_por_categoria(df: pd.DataFrame) -> pd.DataFrame:
+def _montar_ranking(top: pd.Series, nomes: pd.Series) -> pd.DataFrame:
+    """
+    Monta o ranking a partir dos autores selecionados por ``_selecionar_top``.
+
+    Parameters
+    ----------
+    top : pd.Series
+        Score dos autores do ranking, indexado por autor_id.
+    nomes : pd.Series
+        Nome de cada autor, indexado por autor_id.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame com colunas autor_id, autor_nome e score_engajamento.
+    """
+
+    return pd.DataFrame(
+        {
+            "autor_id": top.index,
+            "autor_nome": nomes.loc[top.index].to_numpy(),
+            "score_engajamento": top.to_numpy(),
+        }
+    )
+
+
+def interacoes_por_categoria(
+    df: pd.DataFrame, *, grupos: Optional[DataFrameGroupBy] = None
+) -> pd.DataFrame:
     """
     Agrega interações por categoria de conteúdo.
     
@@ -108,24 +350,30 @@ def interacoes_por_categoria(df: pd.DataFrame) -> pd.DataFrame:
     ----------
     df : pd.DataFrame
         DataFrame processado contendo interações com informações de categoria.
+    grupos : Optional[DataFrameGroupBy], optional
+        Agrupamento pré-construído por ``agrupar_por_categoria``. Se None,
+        é criado a partir de ``df``.
     
     Returns
     -------
     pd.DataFrame
         DataFrame com colunas categoria, interacoes (contagem) e score (soma),
-        ordenado por score decrescente.
+        ordenado por score decrescente. O índice não é renumerado (relatório
+        e gráfico leem apenas as colunas).
     """
 
+    if grupos is None:
+        grupos = agrupar_por_categoria(df)
+
     return (
-        df.groupby("categoria", as_index=False)
+        grupos
         # Agrega contando interações e somando pesos
         .agg(
             interacoes=("interacao_id", "count"),  # Conta número de interações
             score=("peso_interacao", "sum"),       # Soma os pesos (score total)
         )
-        # Ordena por score do maior para o menor
-        .sort_values(by="score", ascending=False)
-        .reset_index(drop=True)
+        # Ordena por score do maior para o menor (estável para empates)
+        .sort_values(by="score", ascending=False, kind="stable")
     )
 
 
@@ -136,6 +384,11 @@ def timeline_engajamento(df: pd.DataFrame) -> pd.DataFrame:
     Esta função agrega as interações por dia, criando uma série temporal
     que mostra a evolução do engajamento ao longo do tempo. Útil para
     identificar tendências e padrões temporais.
+
+    Os timestamps são convertidos em dias desde o primeiro dia e agregados
+    com ``np.bincount`` em uma única passada O(n), sem ``resample`` e sem
+    exigir as linhas em ordem cronológica; os dias sem interações recebem
+    contagem zero naturalmente.
     
     Parameters
     ----------
@@ -146,23 +399,79 @@ def timeline_engajamento(df: pd.DataFrame) -> pd.DataFrame:
     -------
     pd.DataFrame
         DataFrame com colunas data_interacao, interacoes (contagem diária)
-        e score (soma diária de pesos), uma linha por dia.
+        e score (soma diária de pesos), uma linha por dia (inclusive dias
+        sem interações, com valores zerados).
     """
 
-    timeline = (
-        # Define data_interacao como índice para permitir resample
-        df.set_index("data_interacao")
-        # Agrupa por dia (resample com frequência diária)
-        .resample("D")
-        # Agrega contando interações e somando scores por dia
-        .agg(
-            interacoes=("interacao_id", "count"),
-            score=("peso_interacao", "sum"),
-        )
-        # Remove o índice e transforma data_interacao em coluna novamente
+    # Trunca os timestamps para o dia, ignorando datas ausentes (NaT), como
+    # faz o agrupamento por dia do pandas
+    dias = df["data_interacao"].to_numpy().astype("datetime64[D]")
+    pesos = df["peso_interacao"].to_numpy()
+    validos = ~np.isnat(dias)
+    if not validos.all():
+        dias, pesos = dias[validos], pesos[validos]
+    if len(dias) == 0:
+        return _timeline_vazia()
+
+    # Converte em deslocamento (em dias) a partir do primeiro dia, usado
+    # como posição no vetor de contagens
+    primeiro_dia = dias.min()
+    posicoes = (dias - primeiro_dia).astype(np.int64)
+
+    # Conta as interações e soma os pesos de cada dia em uma passada
+    # (a soma ponderada sai em float64, exata para os pesos inteiros)
+    contagens = np.bincount(posicoes)
+    scores = np.bincount(posicoes, weights=pesos)
+
+    return pd.DataFrame(
+        {
+            "data_interacao": pd.date_range(
+                primeiro_dia, periods=len(contagens), freq="D"
+            ),
+            "interacoes": contagens.astype("int64"),
+            "score": scores.astype("int64"),
+        }
+    )
+
+
+def _completar_calendario(
+    dias: np.ndarray, contagens: np.ndarray, scores: np.ndarray
+) -> pd.DataFrame:
+    """
+    Monta a timeline diária incluindo os dias sem interações.
+
+    Parameters
+    ----------
+    dias : np.ndarray
+        Dias com interações (``datetime64[D]``), em ordem crescente.
+    contagens : np.ndarray
+        Quantidade de interações de cada dia.
+    scores : np.ndarray
+        Soma dos pesos de cada dia.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame com colunas data_interacao, interacoes e score, uma linha
+        por dia entre o primeiro e o último dia (dias vazios zerados).
+    """
+
+    timeline = pd.DataFrame(
+        {
+            "data_interacao": dias.astype("datetime64[ns]"),
+            "interacoes": contagens.astype("int64"),
+            "score": scores.astype("int64"),
+        }
+    )
+
+    # Inclui os dias sem interações, como fazia o resample diário
+    calendario = pd.date_range(dias[0], dias[-1], freq="D")
+    return (
+        timeline.set_index("data_interacao")
+        .reindex(calendario, fill_value=0)
+        .rename_axis("data_interacao")
         .reset_index()
     )
-    return timeline
 
 
 def distribuicao_tipo_interacao(df: pd.DataFrame) -> pd.DataFrame:
@@ -185,23 +494,183 @@ def distribuicao_tipo_interacao(df: pd.DataFrame) -> pd.DataFrame:
         percentual (porcentagem do total), ordenado por quantidade decrescente.
     """
 
-    # Conta o total de interações para calcular percentuais
-    total = df["interacao_id"].count()
-    
-    # Agrupa por tipo de interação e conta quantas ocorreram
-    distribuicao = (
-        df.groupby("tipo_interacao", as_index=False)["interacao_id"]
-        .count()
-        .rename(columns={"interacao_id": "quantidade"})
-    )
-    
+    # Conta as ocorrências de cada tipo em uma única passada, já ordenadas
+    # do tipo mais frequente para o menos frequente
+    contagens = df["tipo_interacao"].value_counts(sort=True)
+
+    return _montar_distribuicao(contagens)
+
+
+def _montar_distribuicao(contagens: pd.Series) -> pd.DataFrame:
+    """
+    Monta a tabela de distribuição a partir das contagens por tipo.
+
+    Parameters
+    ----------
+    contagens : pd.Series
+        Quantidade de interações por tipo (índice), já em ordem decrescente.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame com colunas tipo_interacao, quantidade e percentual.
+    """
+
+    # Em colunas category, value_counts lista também categorias sem uso
+    contagens = contagens[contagens > 0]
+
     # Calcula o percentual de cada tipo em relação ao total
-    # Usa np.where para evitar divisão por zero
-    distribuicao["percentual"] = np.where(
-        total == 0, 0.0, (distribuicao["quantidade"] / total * 100).round(2)
+    # (evita divisão por zero quando não há interações)
+    total = contagens.sum()
+    quantidades = contagens.to_numpy()
+    percentuais = (
+        (quantidades * 100.0 / total).round(2) if total else np.zeros(len(contagens))
     )
-    
-    # Ordena do tipo mais frequente para o menos frequente
-    return distribuicao.sort_values(by="quantidade", ascending=False).reset_index(
-        drop=True
+
+    return pd.DataFrame(
+        {
+            "tipo_interacao": contagens.index,
+            "quantidade": quantidades,
+            "percentual": percentuais,
+        }
     )
+
+
+def stream_engagement_metrics(
+    chunks: Iterable[pd.DataFrame], top_n: int = 5
+) -> Dict[str, Any]:
+    """
+    Calcula todas as métricas percorrendo o dataset em blocos.
+
+    Somas e contagens são associativas: cada bloco gera agregados parciais
+    pequenos (por autor, categoria, dia e tipo), combinados ao final. Assim
+    os agregados ficam proporcionais ao tamanho do bloco, e não ao dataset
+    inteiro.
+
+    A exceção são as contagens de valores únicos, que não são associativas:
+    os ids distintos de cada bloco ficam guardados até o final. Para
+    ``interacao_id`` (um id por linha) isso cresce com o número de
+    interações, mas são apenas inteiros (4 bytes por id em ``int32``), bem
+    menos que as linhas completas do dataset.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        Blocos do dataset processado (mesmas colunas de
+        ``build_engagement_dataset``).
+    top_n : int, optional
+        Número de autores a retornar no ranking. Por padrão é 5.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dicionário com as chaves "globais", "ranking", "categorias",
+        "timeline" e "distribuicao", com os mesmos formatos das funções
+        que operam sobre o dataset completo.
+    """
+
+    ids_unicos: Dict[str, List[np.ndarray]] = {
+        "interacao_id": [],
+        "conteudo_id": [],
+        "usuario_id": [],
+    }
+    soma_pesos = 0
+    parciais_autor: List[pd.Series] = []
+    parciais_nome: List[pd.DataFrame] = []
+    parciais_categoria: List[pd.DataFrame] = []
+    parciais_dia: List[pd.DataFrame] = []
+    parciais_tipo: List[pd.Series] = []
+
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+
+        # (a) ids distintos do bloco, unidos ao final
+        for coluna, parciais in ids_unicos.items():
+            parciais.append(_ids_distintos(chunk[coluna]))
+
+        # (b) soma acumulada dos pesos
+        soma_pesos += _soma_pesos(chunk)
+
+        # (c) agregados parciais por autor, categoria e tipo
+        parciais_autor.append(agrupar_por_autor(chunk)["peso_interacao"].sum())
+        parciais_nome.append(
+            chunk[["autor_id", "autor_nome"]].drop_duplicates("autor_id")
+        )
+        parciais_categoria.append(
+            agrupar_por_categoria(chunk).agg(
+                interacoes=("interacao_id", "count"),
+                score=("peso_interacao", "sum"),
+            )
+        )
+        parciais_tipo.append(chunk["tipo_interacao"].value_counts(sort=False))
+
+        # (d) agregados parciais por dia
+        dias = chunk["data_interacao"].to_numpy().astype("datetime64[D]")
+        pesos = chunk["peso_interacao"].to_numpy()
+        parciais_dia.append(
+            pd.DataFrame({"dia": dias, "peso": pesos.astype(np.int64)})
+            .groupby("dia", sort=False)
+            .agg(interacoes=("peso", "size"), score=("peso", "sum"))
+        )
+
+    # Combina os ids distintos de todos os blocos
+    contagens_unicas = {
+        coluna: len(pd.unique(np.concatenate(parciais))) if parciais else 0
+        for coluna, parciais in ids_unicos.items()
+    }
+    total_conteudos = contagens_unicas["conteudo_id"]
+    engajamento_medio = soma_pesos / total_conteudos if total_conteudos else 0.0
+    globais = {
+        "total_interacoes": contagens_unicas["interacao_id"],
+        "conteudos_analisados": total_conteudos,
+        "usuarios_participantes": contagens_unicas["usuario_id"],
+        "engajamento_medio_por_conteudo": round(float(engajamento_medio), 2),
+    }
+
+    if not parciais_autor:
+        # Nenhuma interação: tabelas vazias com as colunas esperadas
+        return metricas_vazias()
+
+    # Ranking: soma os parciais de cada autor
+    scores = pd.concat(parciais_autor).groupby(level=0, sort=False).sum()
+    nomes = (
+        pd.concat(parciais_nome)
+        .drop_duplicates("autor_id")
+        .set_index("autor_id")["autor_nome"]
+    )
+
+    # Categorias: soma os parciais preservando a ordem de primeira ocorrência
+    categorias = (
+        pd.concat(parciais_categoria)
+        .groupby("categoria", as_index=False, sort=False, observed=True)
+        .sum()
+        .sort_values(by="score", ascending=False, kind="stable")
+    )
+
+    # Timeline: soma os parciais de cada dia e completa o calendário
+    diario = pd.concat(parciais_dia).groupby(level=0, sort=True).sum()
+
+    # Distribuição: soma as contagens de cada tipo
+    contagens_tipo = (
+        pd.concat(parciais_tipo)
+        .groupby(level=0, sort=False, observed=True)
+        .sum()
+        .sort_values(ascending=False, kind="stable")
+    )
+
+    return {
+        "globais": globais,
+        "ranking": _montar_ranking(_selecionar_top(scores, top_n), nomes),
+        "categorias": categorias,
+        "timeline": (
+            _completar_calendario(
+                diario.index.to_numpy().astype("datetime64[D]"),
+                diario["interacoes"].to_numpy(),
+                diario["score"].to_numpy(),
+            )
+            if len(diario)
+            else _timeline_vazia()
+        ),
+        "distribuicao": _montar_distribuicao(contagens_tipo),
+    }
@@ -0,0 +1,232 @@
+"""
+Versão em Polars (modo lazy) dos indicadores de engajamento.
+
+Este módulo espelha as funções de ``engajamento.py``, mas cada função recebe
+um ``pl.LazyFrame`` e devolve outro ``pl.LazyFrame`` ainda não executado.
+``calcular_metricas_polars`` coleta todas as consultas de uma só vez com
+``pl.collect_all``: o otimizador do Polars compartilha a leitura do dataset
+entre as consultas e executa as agregações em paralelo em todos os núcleos.
+
+O Polars é uma dependência opcional (``pip install polars``); o pipeline
+padrão continua usando apenas pandas.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import polars as pl
+
+
+def global_engagement_metrics(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Calcula KPIs gerais para acompanhamento rápido.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dataset processado contendo todas as interações com coluna
+        peso_interacao já calculada.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta de uma linha com total_interacoes, conteudos_analisados,
+        usuarios_participantes e engajamento_medio_por_conteudo.
+    """
+
+    total_conteudos = pl.col("conteudo_id").n_unique()
+
+    return lf.select(
+        total_interacoes=pl.col("interacao_id").n_unique(),
+        conteudos_analisados=total_conteudos,
+        usuarios_participantes=pl.col("usuario_id").n_unique(),
+        # Evita divisão por zero retornando 0.0 se não houver conteúdos
+        engajamento_medio_por_conteudo=pl.when(total_conteudos > 0)
+        .then(pl.col("peso_interacao").cast(pl.Int64).sum() / total_conteudos)
+        .otherwise(0.0)
+        .round(2),
+    )
+
+
+def top_autores_por_engajamento(lf: pl.LazyFrame, top_n: int = 5) -> pl.LazyFrame:
+    """
+    Ranking simples de autores ordenado pelo score de engajamento.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dataset processado contendo interações com informações de autor.
+    top_n : int, optional
+        Número de autores a retornar no ranking. Por padrão é 5.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta com colunas autor_id, autor_nome e score_engajamento,
+        ordenada por score decrescente (empates pelo menor autor_id).
+    """
+
+    return (
+        lf.group_by("autor_id")
+        .agg(
+            autor_nome=pl.col("autor_nome").first(),
+            score_engajamento=pl.col("peso_interacao").cast(pl.Int64).sum(),
+        )
+        .sort(["score_engajamento", "autor_id"], descending=[True, False])
+        .head(top_n)
+    )
+
+
+def interacoes_por_categoria(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Agrega interações por categoria de conteúdo.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dataset processado contendo interações com informações de categoria.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta com colunas categoria, interacoes (contagem) e score (soma),
+        ordenada por score decrescente.
+    """
+
+    return (
+        # maintain_order + sort estável reproduzem o desempate do pandas
+        lf.group_by("categoria", maintain_order=True)
+        .agg(
+            interacoes=pl.col("interacao_id").count().cast(pl.Int64),
+            score=pl.col("peso_interacao").cast(pl.Int64).sum(),
+        )
+        .sort("score", descending=True, maintain_order=True)
+    )
+
+
+def timeline_engajamento(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Resume o comportamento diário de engajamento.
+
+    ``group_by_dynamic`` com janelas de um dia equivale ao ``resample("D")``
+    do pandas; os dias sem interações são completados com zero.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dataset processado com coluna data_interacao do tipo datetime.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta com colunas data_interacao, interacoes (contagem diária)
+        e score (soma diária de pesos), uma linha por dia.
+    """
+
+    # Datas ausentes ficam fora da timeline, como no agrupamento do pandas
+    lf = lf.drop_nulls("data_interacao")
+
+    diario = (
+        lf.sort("data_interacao")
+        .group_by_dynamic("data_interacao", every="1d")
+        .agg(
+            interacoes=pl.col("interacao_id").count().cast(pl.Int64),
+            score=pl.col("peso_interacao").cast(pl.Int64).sum(),
+        )
+    )
+
+    # Calendário completo entre o primeiro e o último dia com interações
+    # (``datetime_ranges`` + ``explode`` aceita os limites nulos de um
+    # dataset sem datas, que viram uma linha nula descartada em seguida)
+    calendario = (
+        lf.select(
+            pl.datetime_ranges(
+                pl.col("data_interacao").min().dt.truncate("1d"),
+                pl.col("data_interacao").max().dt.truncate("1d"),
+                interval="1d",
+            ).alias("data_interacao")
+        )
+        .explode("data_interacao")
+        .drop_nulls("data_interacao")
+    )
+
+    return (
+        calendario.join(diario, on="data_interacao", how="left")
+        .with_columns(pl.col("interacoes", "score").fill_null(0))
+        .sort("data_interacao")
+    )
+
+
+def distribuicao_tipo_interacao(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Retorna a participação relativa de cada tipo de interação.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dataset processado contendo interações com coluna tipo_interacao.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta com colunas tipo_interacao, quantidade (contagem) e
+        percentual (porcentagem do total), ordenada por quantidade decrescente.
+    """
+
+    return (
+        lf.group_by("tipo_interacao", maintain_order=True)
+        .agg(quantidade=pl.len().cast(pl.Int64))
+        .with_columns(
+            percentual=(
+                pl.col("quantidade") * 100.0 / pl.col("quantidade").sum()
+            ).round(2)
+        )
+        .sort("quantidade", descending=True, maintain_order=True)
+    )
+
+
+def calcular_metricas_polars(lf: pl.LazyFrame) -> Dict[str, Any]:
+    """
+    Executa as cinco consultas de uma vez e devolve resultados em pandas.
+
+    ``pl.collect_all`` roda um único planejamento para todas as consultas,
+    eliminando subexpressões comuns e paralelizando a execução. Os resultados
+    são convertidos para pandas para que relatório e gráficos funcionem sem
+    alterações.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dataset processado em modo lazy.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dicionário com as mesmas chaves de ``calcular_metricas_engajamento``
+        ("globais", "ranking", "categorias", "timeline", "distribuicao").
+    """
+
+    globais, ranking, categorias, timeline, distribuicao = pl.collect_all(
+        [
+            global_engagement_metrics(lf),
+            top_autores_por_engajamento(lf),
+            interacoes_por_categoria(lf),
+            timeline_engajamento(lf),
+            distribuicao_tipo_interacao(lf),
+        ]
+    )
+
+    metricas_globais = globais.row(0, named=True)
+    # Mantém os mesmos tipos Python do backend pandas (int e float)
+    metricas_globais["engajamento_medio_por_conteudo"] = float(
+        metricas_globais["engajamento_medio_por_conteudo"] or 0.0
+    )
+
+    return {
+        "globais": metricas_globais,
+        "ranking": ranking.to_pandas(),
+        "categorias": categorias.to_pandas(),
+        "timeline": timeline.to_pandas(),
+        "distribuicao": distribuicao.to_pandas(),
+    }
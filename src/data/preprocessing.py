@@ -14,10 +14,14 @@ Este módulo é responsável por:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # Pesos atribuídos a cada tipo de interação para cálculo de score de engajamento
 # Curtidas têm peso menor, compartilhamentos têm peso maior (mais valiosos)
@@ -27,30 +31,215 @@ INTERACTION_WEIGHTS = {
     "compartilhamento": 3,
 }
 
+# Dtype das colunas de texto normalizadas por ``_normalize_str_series``
+_TEXT_DTYPE = pd.ArrowDtype(pa.string())
+
+# Tipos de interação na ordem usada como categorias de tipo_interacao e pesos
+# correspondentes a cada código, calculados uma única vez na importação: o
+# peso de cada linha vira um np.take sobre este vetor (somente leitura, pois
+# é compartilhado com as análises)
+WEIGHT_CATEGORIES = tuple(INTERACTION_WEIGHTS)
+WEIGHTS_BY_CODE = np.fromiter(
+    (INTERACTION_WEIGHTS[tipo] for tipo in WEIGHT_CATEGORIES), dtype=np.int8
+)
+WEIGHTS_BY_CODE.setflags(write=False)
+_TIPO_DTYPE = pd.CategoricalDtype(WEIGHT_CATEGORIES)
+
+# Colunas de baixa cardinalidade usadas como chave de agrupamento nas análises
+# Convertidas para category, os agrupamentos usam códigos inteiros em vez de
+# calcular o hash de cada string
+CATEGORICAL_COLUMNS = (
+    "autor_nome",
+    "categoria",
+    "tipo_interacao",
+    "segmento_autor",
+    "segmento_usuario",
+)
+
 # Diretório onde os datasets processados serão salvos
 PROCESSED_DIR = Path(__file__).resolve().parents[2] / "dados" / "processed"
 
+# Nome (sem extensão) do arquivo com o dataset processado
+PROCESSED_BASENAME = "engajamento"
+
+# Formatos aceitos na persistência: Parquet (colunar, padrão) e CSV (permite
+# acrescentar blocos ao final do arquivo)
+PROCESSED_FORMATS = ("parquet", "csv")
+
+
+def _as_arrow_strings(series: pd.Series) -> Optional[pa.ChunkedArray]:
+    """
+    Obtém os valores de uma série de texto como array Arrow de strings.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Série pandas com valores de texto.
+
+    Returns
+    -------
+    Optional[pa.ChunkedArray]
+        Valores em Arrow (``string`` ou ``large_string``, sem cópia quando a
+        série já é Arrow), ou None se a série contiver valores que não são
+        texto.
+    """
+
+    # Texto já armazenado em Arrow: ``pd.ArrowDtype`` (como o entregue pela
+    # ingestão) ou ``string[pyarrow]`` (``pd.StringDtype("pyarrow")``, cujo
+    # dtype não tem ``pyarrow_dtype`` e cujos dados são ``large_string``)
+    if isinstance(series.array, pd.arrays.ArrowExtensionArray):
+        valores = pa.chunked_array(pa.array(series.array))
+        if pa.types.is_string(valores.type) or pa.types.is_large_string(valores.type):
+            return valores
+        return None
+
+    # Colunas object/string do pandas: conversão única (nulos viram null)
+    try:
+        return pa.chunked_array(
+            [pa.array(series.array, type=pa.string(), from_pandas=True)]
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+def _somente_ascii(valores: pa.ChunkedArray) -> bool:
+    """
+    Indica se um array Arrow de strings contém apenas bytes ASCII.
+
+    A verificação lê diretamente o buffer de dados de cada bloco (uma
+    passada sobre bytes, sem decodificar UTF-8). O buffer inteiro é
+    considerado, mesmo quando o array é uma fatia: um byte não ASCII fora da
+    fatia apenas desvia para o caminho UTF-8, que é sempre correto.
+
+    Parameters
+    ----------
+    valores : pa.ChunkedArray
+        Array Arrow de strings.
+
+    Returns
+    -------
+    bool
+        True se nenhum byte for maior que 127.
+    """
+
+    for bloco in valores.chunks:
+        dados = bloco.buffers()[2]
+        if dados is not None and np.frombuffer(dados, dtype=np.uint8).max(initial=0) > 127:
+            return False
+    return True
 
-def _normalize_str_series(series: pd.Series) -> pd.Series:
+
+def _normalize_str_series(series: pd.Series, *, lower: bool = True) -> pd.Series:
     """
     Normaliza strings removendo espaços extras e aplicando minúsculas.
     
     Esta função auxiliar garante consistência nos dados de texto, facilitando
     comparações e agregações posteriores.
+
+    O texto é processado pelos kernels vetorizados do ``pyarrow.compute``
+    (sem arrays intermediários de objetos Python); colunas Arrow, como as
+    entregues pela ingestão, nem precisam de conversão. Texto só com ASCII
+    usa os kernels ``ascii_*``, que trabalham byte a byte sem decodificar
+    UTF-8. Séries com valores que não são texto usam o caminho ``.str`` do
+    pandas. Os dois caminhos devolvem o mesmo dtype (``_TEXT_DTYPE``).
     
     Parameters
     ----------
     series : pd.Series
         Série pandas contendo valores de texto a serem normalizados.
+    lower : bool, optional
+        Se False, apenas remove os espaços extras (mantém maiúsculas).
     
     Returns
     -------
     pd.Series
-        Série com strings normalizadas (sem espaços extras, em minúsculas).
+        Série com strings normalizadas (sem espaços extras, em minúsculas),
+        com dtype ``_TEXT_DTYPE``.
     """
 
+    # Caminho rápido: kernels do pyarrow.compute sobre o texto em Arrow
+    valores = _as_arrow_strings(series)
+    if valores is not None:
+        if _somente_ascii(valores):
+            valores = pc.ascii_trim_whitespace(valores)
+            if lower:
+                valores = pc.ascii_lower(valores)
+        else:
+            valores = pc.utf8_trim_whitespace(valores)
+            if lower:
+                valores = pc.utf8_lower(valores)
+        # string[pyarrow] chega como large_string; a saída é sempre string
+        valores = valores.cast(_TEXT_DTYPE.pyarrow_dtype)
+        return pd.Series(
+            pd.arrays.ArrowExtensionArray(valores), index=series.index, name=series.name
+        )
+
     # Converte para tipo string do pandas, remove espaços e converte para minúsculas
-    return series.astype("string").str.strip().str.lower()
+    normalized = series.astype("string").str.strip()
+    if lower:
+        normalized = normalized.str.lower()
+    return normalized.astype(_TEXT_DTYPE)
+
+
+def _ids_inteiros(df: pd.DataFrame, colunas: Iterable[str]) -> Dict[str, pd.Series]:
+    """
+    Converte colunas de identificadores em texto para inteiros.
+
+    A ingestão já entrega os ids como inteiros; DataFrames montados por
+    outras fontes podem trazê-los como texto, e deduplicação e joins sobre
+    strings calculam o hash de cada objeto Python. Ids numéricos em texto
+    viram int64 (hashtable de inteiros); ids não numéricos ficam como estão.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame com as colunas de ids.
+    colunas : Iterable[str]
+        Nomes das colunas de ids.
+
+    Returns
+    -------
+    Dict[str, pd.Series]
+        Colunas convertidas (apenas as que mudaram), prontas para ``assign``.
+    """
+
+    convertidas = {}
+    for coluna in colunas:
+        serie = df[coluna]
+        if pd.api.types.is_integer_dtype(serie.dtype):
+            continue
+        try:
+            numerica = pd.to_numeric(serie)
+        except (ValueError, TypeError):
+            continue
+        # Só converte se todos os valores forem inteiros (sem nulos/decimais)
+        if pd.api.types.is_integer_dtype(numerica.dtype):
+            convertidas[coluna] = numerica.astype(np.int64)
+    return convertidas
+
+
+def _to_datetime(series: pd.Series) -> pd.Series:
+    """
+    Converte uma coluna para datetime, marcando valores inválidos como NaT.
+
+    Colunas já temporais (como as lidas pela ingestão) são devolvidas sem
+    nova conversão; textos são interpretados como ISO 8601 pelo parser
+    vetorizado do pandas, sem o fallback linha a linha do dateutil.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Série com datas em texto ou já em datetime.
+
+    Returns
+    -------
+    pd.Series
+        Série com dtype datetime.
+    """
+
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series
+    return pd.to_datetime(series, format="ISO8601", errors="coerce")
 
 
 def clean_usuarios(df: pd.DataFrame) -> pd.DataFrame:
@@ -61,6 +250,7 @@ def clean_usuarios(df: pd.DataFrame) -> pd.DataFrame:
     - Nomes sem espaços extras
     - Segmentos normalizados (minúsculas, sem espaços)
     - Remoção de usuários duplicados (mantém apenas um por usuario_id)
+    - Segmento como category (códigos inteiros nos agrupamentos)
     
     Parameters
     ----------
@@ -73,19 +263,20 @@ def clean_usuarios(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame limpo e padronizado.
     """
 
-    # Cria cópia para não modificar o DataFrame original
-    cleaned = df.copy()
-    
-    # Normaliza nomes: remove espaços extras
-    cleaned["nome"] = cleaned["nome"].astype("string").str.strip()
-    
-    # Normaliza segmentos: remove espaços e converte para minúsculas
-    cleaned["segmento"] = _normalize_str_series(cleaned["segmento"])
+    # assign devolve um novo DataFrame substituindo só as colunas tocadas,
+    # sem copiar o DataFrame original inteiro
+    cleaned = df.assign(
+        # Ids numéricos em texto viram inteiros (dedup e joins por inteiro)
+        **_ids_inteiros(df, ["usuario_id"]),
+        # Normaliza nomes: remove espaços extras
+        nome=_normalize_str_series(df["nome"], lower=False),
+        # Normaliza segmentos: remove espaços, converte para minúsculas e
+        # guarda como category
+        segmento=_normalize_str_series(df["segmento"]).astype("category"),
+    )
     
     # Remove duplicatas baseado no ID do usuário e reseta índices
-    cleaned = cleaned.drop_duplicates(subset="usuario_id").reset_index(drop=True)
-    
-    return cleaned
+    return cleaned.drop_duplicates(subset="usuario_id").reset_index(drop=True)
 
 
 def clean_conteudos(df: pd.DataFrame) -> pd.DataFrame:
@@ -93,7 +284,7 @@ def clean_conteudos(df: pd.DataFrame) -> pd.DataFrame:
     Padroniza categorias e garante tipos corretos.
     
     Esta função limpa o dataset de conteúdos garantindo:
-    - Categorias normalizadas (minúsculas, sem espaços)
+    - Categorias normalizadas (minúsculas, sem espaços) como category
     - Datas de publicação válidas (remove linhas com datas inválidas)
     
     Parameters
@@ -107,15 +298,14 @@ def clean_conteudos(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame limpo com apenas conteúdos com datas válidas.
     """
 
-    # Cria cópia para não modificar o DataFrame original
-    cleaned = df.copy()
-    
-    # Normaliza categorias: remove espaços e converte para minúsculas
-    cleaned["categoria"] = _normalize_str_series(cleaned["categoria"])
-    
-    # Converte data_publicacao para datetime, marcando inválidas como NaT
-    cleaned["data_publicacao"] = pd.to_datetime(
-        cleaned["data_publicacao"], errors="coerce"
+    # Substitui apenas as colunas tratadas, sem copiar o DataFrame inteiro
+    cleaned = df.assign(
+        # Ids numéricos em texto viram inteiros (mesmo tipo das chaves de join)
+        **_ids_inteiros(df, ["conteudo_id", "autor_id"]),
+        # Normaliza categorias: remove espaços e converte para minúsculas
+        categoria=_normalize_str_series(df["categoria"]).astype("category"),
+        # Converte data_publicacao para datetime, marcando inválidas como NaT
+        data_publicacao=_to_datetime(df["data_publicacao"]),
     )
     
     # Remove linhas onde a data não pôde ser parseada (essenciais para análises temporais)
@@ -129,10 +319,10 @@ def clean_interacoes(df: pd.DataFrame) -> pd.DataFrame:
     Normaliza o tipo de interação e converte timestamps.
     
     Esta função limpa o dataset de interações garantindo:
-    - Tipos de interação normalizados
+    - Tipos de interação normalizados (category na ordem de INTERACTION_WEIGHTS)
     - Datas válidas
     - Apenas tipos de interação conhecidos (filtra inválidos)
-    - Criação da coluna peso_interacao para cálculos de score
+    - Criação da coluna peso_interacao (int8, sem nulos) para cálculos de score
     
     Parameters
     ----------
@@ -145,31 +335,90 @@ def clean_interacoes(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame limpo com coluna peso_interacao adicionada.
     """
 
-    # Cria cópia para não modificar o DataFrame original
-    cleaned = df.copy()
-    
-    # Normaliza tipos de interação: remove espaços e converte para minúsculas
-    cleaned["tipo_interacao"] = _normalize_str_series(cleaned["tipo_interacao"])
-    
-    # Converte data_interacao para datetime, marcando inválidas como NaT
-    cleaned["data_interacao"] = pd.to_datetime(
-        cleaned["data_interacao"], errors="coerce"
+    # Substitui apenas as colunas tratadas, sem copiar o DataFrame inteiro
+    cleaned = df.assign(
+        # Ids numéricos em texto viram inteiros (mesmo tipo das chaves de join)
+        **_ids_inteiros(df, ["interacao_id", "conteudo_id", "usuario_id"]),
+        # Normaliza tipos de interação: remove espaços, converte para
+        # minúsculas e guarda como category com as categorias na ordem de
+        # INTERACTION_WEIGHTS (tipos desconhecidos ficam com código -1)
+        tipo_interacao=_normalize_str_series(df["tipo_interacao"]).astype(
+            _TIPO_DTYPE
+        ),
+        # Converte data_interacao para datetime, marcando inválidas como NaT
+        data_interacao=_to_datetime(df["data_interacao"]),
     )
     
     # Remove linhas onde a data não pôde ser parseada
     cleaned = cleaned.dropna(subset=["data_interacao"])
     
     # Filtra apenas tipos de interação válidos (definidos em INTERACTION_WEIGHTS)
-    cleaned = cleaned[cleaned["tipo_interacao"].isin(INTERACTION_WEIGHTS)].copy()
+    # comparando os códigos inteiros, sem tocar nas strings
+    codes = cleaned["tipo_interacao"].cat.codes.to_numpy()
+    validos = codes >= 0
     
-    # Adiciona coluna peso_interacao mapeando o tipo para seu peso correspondente
+    # Adiciona coluna peso_interacao buscando o peso de cada código em um vetor
+    # de 3 posições (np.take em C, sem consulta ao dicionário por linha)
     # Esta coluna será usada para calcular scores de engajamento
-    cleaned["peso_interacao"] = cleaned["tipo_interacao"].map(INTERACTION_WEIGHTS)
-    
-    return cleaned.reset_index(drop=True)
+    # Como o filtro deixa apenas tipos conhecidos, os pesos nunca são nulos;
+    # int8 comporta os pesos e reduz os bytes lidos em cada soma
+    # (assign sobre o recorte evita a cópia defensiva antes da atribuição,
+    # e o índice é refeito uma única vez)
+    return (
+        cleaned.loc[validos]
+        .assign(peso_interacao=np.take(WEIGHTS_BY_CODE, codes[validos]))
+        .reset_index(drop=True)
+    )
+
+
+def _combinar_interacoes(
+    interacoes: pd.DataFrame,
+    conteudos_idx: pd.DataFrame,
+    autores_idx: pd.DataFrame,
+    participantes_idx: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Junta interações limpas às tabelas de dimensão e descarta incompletas.
+
+    Parameters
+    ----------
+    interacoes : pd.DataFrame
+        Interações já limpas por ``clean_interacoes``.
+    conteudos_idx, autores_idx, participantes_idx : pd.DataFrame
+        Tabelas de dimensão indexadas pela respectiva chave de junção.
+
+    Returns
+    -------
+    pd.DataFrame
+        Interações com as colunas de conteúdo, autor e usuário, apenas as
+        linhas com todas as informações essenciais.
+    """
+
+    # Realiza joins sequenciais para combinar todos os dados
+    # 1. Junta interações com conteúdos (left join para manter todas as interações)
+    # 2. Junta com informações do autor do conteúdo
+    # 3. Junta com informações do usuário que interagiu
+    # validate="m:1" garante que cada chave exista no máximo uma vez na
+    # tabela de dimensão (uma chave duplicada multiplicaria interações)
+    dataset = (
+        interacoes.join(conteudos_idx, on="conteudo_id", how="left", validate="m:1")
+        .join(autores_idx, on="autor_id", how="left", validate="m:1")
+        .join(participantes_idx, on="usuario_id", how="left", validate="m:1")
+    )
+
+    # Remove linhas onde informações essenciais estão faltando
+    # (uma única máscara booleana combinada no NumPy e um único recorte, em vez
+    # da varredura coluna a coluna do dropna)
+    essenciais = ["autor_nome", "usuario_nome", "categoria", "data_publicacao"]
+    completas = np.logical_and.reduce(
+        [dataset[coluna].notna().to_numpy() for coluna in essenciais]
+    )
+    return dataset.iloc[completas]
 
 
-def build_engagement_dataset(datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+def build_engagement_dataset(
+    datasets: Dict[str, pd.DataFrame], *, n_batches: int = 1
+) -> pd.DataFrame:
     """
     Combina os datasets em uma visão única pronta para análises.
 
@@ -182,6 +431,16 @@ def build_engagement_dataset(datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     - informações do usuário que interagiu;
     - pesos de interação para facilitar métricas.
 
+    As colunas de ``CATEGORICAL_COLUMNS`` são entregues com dtype
+    ``category`` para acelerar os agrupamentos da camada analítica. As
+    linhas mantêm a ordem das interações de origem (a timeline agrega por
+    dia sem depender da ordem, então o dataset não é reordenado).
+
+    Com ``n_batches > 1``, as interações são divididas em trechos
+    contíguos, limpos e combinados em paralelo (threads) contra as mesmas
+    tabelas de dimensão, e concatenados uma única vez ao final; o resultado
+    é idêntico ao processamento em um único lote.
+
     Parameters
     ----------
     datasets : Dict[str, pd.DataFrame]
@@ -189,91 +448,188 @@ def build_engagement_dataset(datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         - "usuarios": DataFrame de usuários
         - "conteudos": DataFrame de conteúdos
         - "interacoes": DataFrame de interações
+    n_batches : int, optional
+        Número de lotes em que as interações são processadas. Por padrão é 1.
 
     Returns
     -------
     pd.DataFrame
         DataFrame consolidado com todas as informações necessárias
         para análises de engajamento.
+
+    Raises
+    ------
+    ValueError
+        Se ``n_batches`` for menor que 1.
+    pd.errors.MergeError
+        Se houver ``conteudo_id`` repetido entre os conteúdos válidos.
     """
 
-    # Limpa cada dataset individualmente antes de combiná-los
+    if n_batches < 1:
+        raise ValueError("n_batches deve ser maior que zero.")
+
+    # Limpa as tabelas de dimensão (pequenas) uma única vez
     usuarios = clean_usuarios(datasets["usuarios"])
     conteudos = clean_conteudos(datasets["conteudos"])
-    interacoes = clean_interacoes(datasets["interacoes"])
+
+    # Indexa as tabelas de dimensão pela chave de junção: o join consulta a
+    # hashtable do índice e não repete a coluna-chave no resultado
+    conteudos_idx = conteudos.set_index("conteudo_id")
+
+    # Indexa os usuários uma única vez: as duas visões abaixo são apenas
+    # renomeações sem cópia (copy=False) que compartilham os mesmos arrays e
+    # o mesmo índice, cuja hashtable é construída uma vez e usada nos dois joins
+    usuarios_idx = usuarios.set_index("usuario_id")
 
     # Prepara visão de autores: renomeia colunas para distinguir do usuário que interage
-    autores = usuarios.rename(
+    # O nome do autor vira category antes do join, a partir da tabela completa
+    # de usuários: o join copia códigos em vez de strings e todas as execuções
+    # (inclusive cada lote e cada bloco do modo em blocos) compartilham as
+    # mesmas categorias, de modo que concatenações não recaiam para object
+    autores_idx = usuarios_idx.rename(
         columns={
-            "usuario_id": "autor_id",
             "nome": "autor_nome",
             "segmento": "segmento_autor",
-        }
+        },
+        copy=False,
     )
+    autores_idx["autor_nome"] = autores_idx["autor_nome"].astype("category")
     
     # Prepara visão de participantes: renomeia colunas para distinguir do autor
-    participantes = usuarios.rename(
+    participantes_idx = usuarios_idx.rename(
         columns={
-            "usuario_id": "usuario_id",
             "nome": "usuario_nome",
             "segmento": "segmento_usuario",
-        }
+        },
+        copy=False,
     )
 
-    # Realiza joins sequenciais para combinar todos os dados
-    # 1. Junta interações com conteúdos (left join para manter todas as interações)
-    # 2. Junta com informações do autor do conteúdo
-    # 3. Junta com informações do usuário que interagiu
-    dataset = (
-        interacoes.merge(conteudos, on="conteudo_id", how="left")
-        .merge(autores, on="autor_id", how="left")
-        .merge(participantes, on="usuario_id", how="left")
-        # Remove linhas onde informações essenciais estão faltando
-        .dropna(
-            subset=[
-                "autor_nome",
-                "usuario_nome",
-                "categoria",
-                "data_publicacao",
-            ]
+    def processar_lote(interacoes: pd.DataFrame) -> pd.DataFrame:
+        return _combinar_interacoes(
+            clean_interacoes(interacoes), conteudos_idx, autores_idx, participantes_idx
         )
-        .reset_index(drop=True)
-    )
+
+    brutas = datasets["interacoes"]
+    if n_batches == 1:
+        dataset = processar_lote(brutas).reset_index(drop=True)
+    else:
+        # Valida as chaves das dimensões antes de iniciar as threads (o mesmo
+        # erro do validate="m:1" dos joins, mas uma vez em vez de por lote);
+        # a verificação também deixa prontas as hashtables que todos os
+        # lotes consultam
+        dimensoes = {"conteudo_id": conteudos_idx, "usuario_id": usuarios_idx}
+        for chave, tabela in dimensoes.items():
+            if not tabela.index.is_unique:
+                raise pd.errors.MergeError(
+                    f"{chave} repetido nas tabelas de dimensão; "
+                    "cada chave deve aparecer uma única vez."
+                )
+
+        # Trechos contíguos preservam a ordem original das interações, então
+        # o resultado sai na mesma ordem do lote único
+        limites = np.linspace(0, len(brutas), n_batches + 1).astype(int)
+        lotes = [
+            brutas.iloc[inicio:fim] for inicio, fim in zip(limites[:-1], limites[1:])
+        ]
+        with ThreadPoolExecutor(max_workers=n_batches) as executor:
+            partes = list(executor.map(processar_lote, lotes))
+
+        # Concatena todos os lotes de uma só vez
+        dataset = pd.concat(partes, ignore_index=True)
+
+    # As chaves de agrupamento já chegam como category (códigos inteiros) da
+    # limpeza e das visões acima; converte apenas o que ainda não for
+    for coluna in CATEGORICAL_COLUMNS:
+        if not isinstance(dataset[coluna].dtype, pd.CategoricalDtype):
+            dataset[coluna] = dataset[coluna].astype("category")
 
     # Cria coluna derivada com apenas a data (sem hora) para agregações diárias
-    dataset["dia_interacao"] = dataset["data_interacao"].dt.date
+    # Truncar para meia-noite mantém um datetime64 contíguo de 8 bytes por
+    # linha, em vez de um objeto datetime.date do Python por linha
+    dataset["dia_interacao"] = dataset["data_interacao"].dt.floor("D")
     
     return dataset
 
 
-def persist_dataset(df: pd.DataFrame, filename: str = "engajamento.csv") -> Path:
+def persist_dataset(
+    df: pd.DataFrame,
+    filename: Optional[str] = None,
+    *,
+    formato: Optional[str] = None,
+    append: bool = False,
+) -> Path:
     """
     Salva o dataset processado para reuso em execuções futuras.
     
-    Esta função salva o DataFrame processado em formato CSV na pasta
-    `dados/processed/`, permitindo que análises subsequentes possam
-    usar os dados já processados sem precisar reprocessar tudo.
+    Esta função salva o DataFrame processado na pasta `dados/processed/`,
+    permitindo que análises subsequentes possam usar os dados já
+    processados sem precisar reprocessar tudo.
+
+    O formato padrão é Parquet (compressão zstd): escrita e leitura
+    colunares, sem formatar cada valor como texto, e as colunas category
+    e datetime voltam com seus tipos em ``pd.read_parquet``. O CSV continua
+    disponível, inclusive para acrescentar blocos a um arquivo existente.
     
     Parameters
     ----------
     df : pd.DataFrame
         DataFrame processado a ser salvo.
-    filename : str, optional
-        Nome do arquivo CSV. Por padrão é "engajamento.csv".
+    filename : Optional[str], optional
+        Nome do arquivo. Por padrão é "engajamento.<formato>".
+    formato : Optional[str], optional
+        "parquet" ou "csv". Se None, é deduzido da extensão de ``filename``
+        (".parquet" ou ".csv"); sem ``filename``, o padrão é "parquet".
+    append : bool, optional
+        Se True, acrescenta as linhas ao final do arquivo existente (sem
+        repetir o cabeçalho). Usado no processamento em blocos; exige
+        ``formato="csv"``.
 
     Returns
     -------
     Path
-        Caminho absoluto do arquivo CSV criado.
+        Caminho absoluto do arquivo criado.
+
+    Raises
+    ------
+    ValueError
+        Se o formato for desconhecido, não puder ser deduzido da extensão,
+        divergir da extensão de ``filename`` ou se ``append`` for usado com
+        Parquet.
     """
 
+    # Formato indicado pela extensão do arquivo (ex.: "saida.csv" -> "csv")
+    extensao = Path(filename).suffix.lstrip(".").lower() if filename else ""
+    if formato is None:
+        if extensao and extensao not in PROCESSED_FORMATS:
+            raise ValueError(
+                f"Não foi possível deduzir o formato de {filename}; "
+                "informe formato='parquet' ou formato='csv'."
+            )
+        formato = extensao or "parquet"
+    elif extensao in PROCESSED_FORMATS and extensao != formato:
+        raise ValueError(
+            f"O formato {formato} não corresponde à extensão de {filename}."
+        )
+
+    if formato not in PROCESSED_FORMATS:
+        raise ValueError(f"Formato desconhecido: {formato}")
+    if append and formato != "csv":
+        raise ValueError("append só é suportado no formato csv.")
+
     # Cria o diretório se não existir
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
     
     # Define o caminho completo do arquivo de saída
-    output_path = PROCESSED_DIR / filename
-    
-    # Salva o DataFrame em CSV sem incluir o índice
-    df.to_csv(output_path, index=False)
+    output_path = PROCESSED_DIR / (filename or f"{PROCESSED_BASENAME}.{formato}")
+
+    if formato == "parquet":
+        # Salva o DataFrame em Parquet sem incluir o índice
+        df.to_parquet(output_path, engine="pyarrow", compression="zstd", index=False)
+    else:
+        # Salva o DataFrame em CSV sem incluir o índice
+        # (no modo append, o cabeçalho já foi escrito pelo primeiro bloco)
+        df.to_csv(
+            output_path, index=False, mode="a" if append else "w", header=not append
+        )
     
     return output_path
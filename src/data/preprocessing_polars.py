@@ -0,0 +1,286 @@
+"""
+Versão em Polars (modo lazy) do preprocessamento.
+
+Este módulo espelha as funções de ``preprocessing.py``: a limpeza das três
+tabelas e as junções são descritas como um único ``pl.LazyFrame`` e
+executadas de uma só vez, o que permite ao otimizador do Polars aplicar os
+filtros antes das junções e paralelizar os kernels de texto.
+
+O pipeline usa o resultado em Polars diretamente: as métricas são
+calculadas sobre ele (``engajamento_polars``) e ``persist_dataset_polars``
+grava o Parquet sem passar pelo pandas. ``build_engagement_dataset_polars``
+converte para pandas para quem precisa do mesmo formato do preprocessamento
+em pandas. O Polars é uma dependência opcional (``pip install polars``).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import polars as pl
+
+from src.data.ingestion import TIMESTAMP_PARSERS
+from src.data.preprocessing import (
+    CATEGORICAL_COLUMNS,
+    INTERACTION_WEIGHTS,
+    PROCESSED_BASENAME,
+    PROCESSED_DIR,
+    WEIGHT_CATEGORIES,
+)
+
+
+def _normalize_str_expr(coluna: str) -> pl.Expr:
+    """
+    Remove espaços extras e aplica minúsculas a uma coluna de texto.
+
+    Parameters
+    ----------
+    coluna : str
+        Nome da coluna de texto.
+
+    Returns
+    -------
+    pl.Expr
+        Expressão com o texto normalizado.
+    """
+
+    return pl.col(coluna).str.strip_chars().str.to_lowercase()
+
+
+def _to_datetime_expr(lf: pl.LazyFrame, coluna: str) -> pl.Expr:
+    """
+    Converte uma coluna para datetime, marcando valores inválidos como nulos.
+
+    Colunas já temporais (lidas pela ingestão) são mantidas; colunas de texto
+    são interpretadas com os formatos de ``TIMESTAMP_PARSERS``.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Tabela que contém a coluna.
+    coluna : str
+        Nome da coluna de data.
+
+    Returns
+    -------
+    pl.Expr
+        Expressão com a coluna em ``Datetime("ns")``.
+    """
+
+    if lf.collect_schema()[coluna] != pl.String:
+        return pl.col(coluna).cast(pl.Datetime("ns"))
+
+    # Tenta cada formato aceito e fica com o primeiro que reconhecer o valor
+    return pl.coalesce(
+        pl.col(coluna).str.to_datetime(formato, time_unit="ns", strict=False)
+        for formato in TIMESTAMP_PARSERS
+    )
+
+
+def clean_usuarios(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Remove duplicidades e padroniza textos dos usuários.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dados brutos de usuários.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta com nomes sem espaços extras, segmentos normalizados e um
+        registro por usuario_id (o primeiro).
+    """
+
+    return lf.with_columns(
+        pl.col("nome").str.strip_chars(),
+        _normalize_str_expr("segmento"),
+    ).unique(subset="usuario_id", keep="first", maintain_order=True)
+
+
+def clean_conteudos(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Padroniza categorias e garante datas de publicação válidas.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dados brutos de conteúdos.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta apenas com os conteúdos de data válida.
+    """
+
+    return lf.with_columns(
+        _normalize_str_expr("categoria"),
+        _to_datetime_expr(lf, "data_publicacao"),
+    ).drop_nulls(subset="data_publicacao")
+
+
+def clean_interacoes(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Normaliza o tipo de interação, converte timestamps e calcula pesos.
+
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Dados brutos de interações.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta apenas com interações de data válida e tipo conhecido,
+        acrescida da coluna peso_interacao (Int8).
+    """
+
+    return (
+        lf.with_columns(
+            _normalize_str_expr("tipo_interacao"),
+            _to_datetime_expr(lf, "data_interacao"),
+        )
+        .drop_nulls(subset="data_interacao")
+        .filter(pl.col("tipo_interacao").is_in(list(WEIGHT_CATEGORIES)))
+        .with_columns(
+            peso_interacao=pl.col("tipo_interacao").replace_strict(
+                INTERACTION_WEIGHTS, return_dtype=pl.Int8
+            )
+        )
+    )
+
+
+def build_engagement_lazyframe(datasets: Dict[str, pd.DataFrame]) -> pl.LazyFrame:
+    """
+    Descreve o dataset consolidado como uma consulta lazy.
+
+    Parameters
+    ----------
+    datasets : Dict[str, pd.DataFrame]
+        Dicionário com os datasets brutos "usuarios", "conteudos" e
+        "interacoes".
+
+    Returns
+    -------
+    pl.LazyFrame
+        Consulta com as mesmas colunas de
+        ``preprocessing.build_engagement_dataset``, na ordem das interações.
+    """
+
+    usuarios = clean_usuarios(pl.from_pandas(datasets["usuarios"]).lazy())
+    conteudos = clean_conteudos(pl.from_pandas(datasets["conteudos"]).lazy())
+    interacoes = clean_interacoes(pl.from_pandas(datasets["interacoes"]).lazy())
+
+    # Visões de autores e participantes a partir da mesma tabela de usuários
+    autores = usuarios.rename(
+        {"usuario_id": "autor_id", "nome": "autor_nome", "segmento": "segmento_autor"}
+    )
+    participantes = usuarios.rename(
+        {"nome": "usuario_nome", "segmento": "segmento_usuario"}
+    )
+
+    # Left joins preservando a ordem das interações (validate="m:1" rejeita
+    # chaves repetidas nas tabelas de dimensão, como no pandas)
+    opcoes_join = {"how": "left", "validate": "m:1", "maintain_order": "left"}
+    return (
+        interacoes.join(conteudos, on="conteudo_id", **opcoes_join)
+        .join(autores, on="autor_id", **opcoes_join)
+        .join(participantes, on="usuario_id", **opcoes_join)
+        # Remove linhas onde informações essenciais estão faltando
+        .drop_nulls(
+            subset=["autor_nome", "usuario_nome", "categoria", "data_publicacao"]
+        )
+        # Coluna derivada com apenas a data (sem hora) para agregações diárias
+        # (meia-noite do dia, no mesmo dtype datetime do pandas)
+        .with_columns(dia_interacao=pl.col("data_interacao").dt.truncate("1d"))
+    )
+
+
+def build_engagement_dataset_polars(datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Combina os datasets com Polars e devolve o resultado em pandas.
+
+    Equivalente a ``preprocessing.build_engagement_dataset``: mesmas colunas,
+    mesma ordem de linhas e colunas de ``CATEGORICAL_COLUMNS`` como
+    ``category``.
+
+    Parameters
+    ----------
+    datasets : Dict[str, pd.DataFrame]
+        Dicionário com os datasets brutos "usuarios", "conteudos" e
+        "interacoes".
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame consolidado pronto para as análises.
+    """
+
+    dataset = build_engagement_lazyframe(datasets).collect().to_pandas()
+
+    # Reproduz os dtypes categóricos do preprocessamento em pandas
+    for coluna in CATEGORICAL_COLUMNS:
+        if coluna == "tipo_interacao":
+            tipo = pd.CategoricalDtype(WEIGHT_CATEGORIES)
+            dataset[coluna] = dataset[coluna].astype(tipo)
+        else:
+            dataset[coluna] = dataset[coluna].astype("category")
+
+    return dataset
+
+
+def _categorical_exprs() -> List[pl.Expr]:
+    """
+    Converte as colunas de ``CATEGORICAL_COLUMNS`` para tipos categóricos.
+
+    ``tipo_interacao`` vira ``pl.Enum`` na ordem de ``WEIGHT_CATEGORIES``,
+    como as categorias do preprocessamento em pandas.
+
+    Returns
+    -------
+    List[pl.Expr]
+        Uma expressão por coluna categórica.
+    """
+
+    return [
+        pl.col(coluna).cast(
+            pl.Enum(list(WEIGHT_CATEGORIES))
+            if coluna == "tipo_interacao"
+            else pl.Categorical
+        )
+        for coluna in CATEGORICAL_COLUMNS
+    ]
+
+
+def persist_dataset_polars(df: pl.DataFrame, filename: Optional[str] = None) -> Path:
+    """
+    Salva o dataset processado pelo Polars em Parquet.
+
+    Equivalente a ``preprocessing.persist_dataset`` no formato Parquet:
+    mesmo destino, compressão zstd e colunas de ``CATEGORICAL_COLUMNS``
+    gravadas como dicionário (``category`` em ``pd.read_parquet``).
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        Dataset coletado de ``build_engagement_lazyframe``.
+    filename : Optional[str], optional
+        Nome do arquivo. Por padrão é "engajamento.parquet".
+
+    Returns
+    -------
+    Path
+        Caminho absoluto do arquivo criado.
+    """
+
+    # Cria o diretório se não existir
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
+    output_path = PROCESSED_DIR / (filename or f"{PROCESSED_BASENAME}.parquet")
+    df.with_columns(_categorical_exprs()).write_parquet(
+        output_path, compression="zstd"
+    )
+    return output_path
@@ -7,8 +7,9 @@ em formato Markdown, criando relatórios legíveis e bem estruturados.
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
 
 import pandas as pd
 
@@ -16,12 +17,18 @@ import pandas as pd
 RELATORIOS_DIR = Path(__file__).resolve().parents[2] / "relatorios"
 
 
-def dataframe_to_markdown(df: pd.DataFrame, headers: Iterable[str]) -> str:
+def dataframe_to_markdown(
+    df: pd.DataFrame,
+    headers: Iterable[str],
+    columns: Optional[Iterable[str]] = None,
+) -> str:
     """
     Converte um DataFrame pequeno em uma tabela Markdown sem dependências.
     
-    Esta função auxiliar cria tabelas Markdown manualmente, sem usar bibliotecas
-    externas, garantindo compatibilidade e simplicidade.
+    Esta função auxiliar cria tabelas Markdown manualmente, sem depender de
+    ``DataFrame.to_markdown`` (tabulate), garantindo compatibilidade e
+    simplicidade. As colunas são convertidas uma única vez em uma matriz
+    NumPy, percorrida linha a linha sem criar objetos do pandas.
     
     Parameters
     ----------
@@ -29,6 +36,9 @@ def dataframe_to_markdown(df: pd.DataFrame, headers: Iterable[str]) -> str:
         DataFrame a ser convertido em tabela Markdown.
     headers : Iterable[str]
         Lista de nomes das colunas que devem aparecer no cabeçalho da tabela.
+    columns : Optional[Iterable[str]], optional
+        Colunas do DataFrame exibidas sob cada cabeçalho, na mesma ordem.
+        Se None, usa os próprios ``headers`` (dispensa um ``rename`` prévio).
     
     Returns
     -------
@@ -36,17 +46,21 @@ def dataframe_to_markdown(df: pd.DataFrame, headers: Iterable[str]) -> str:
         String contendo a tabela formatada em Markdown.
     """
 
+    headers = list(headers)
+    columns = headers if columns is None else list(columns)
+
     # Cria linha de cabeçalho: | Col1 | Col2 | Col3 |
     header_row = "| " + " | ".join(headers) + " |"
     
     # Cria separador: | --- | --- | --- |
     separator = "| " + " | ".join("---" for _ in headers) + " |"
     
+    # Extrai as colunas uma única vez para uma matriz NumPy e itera sobre
+    # suas linhas, sem acessar colunas por nome dentro do laço
+    rows = df[columns].to_numpy()
+
     # Cria linhas de conteúdo: uma linha por linha do DataFrame
-    content_rows = [
-        "| " + " | ".join(str(row[h]) for h in headers) + " |"
-        for _, row in df.iterrows()
-    ]
+    content_rows = ["| " + " | ".join(map(str, row)) + " |" for row in rows]
     
     # Junta tudo em uma única string separada por quebras de linha
     return "\n".join([header_row, separator, *content_rows])
@@ -95,46 +109,37 @@ def build_markdown_report(
         linhas_metricas,
         
         "## Autores com Maior Engajamento",
-        # Converte DataFrame em tabela Markdown com colunas renomeadas
+        # Converte DataFrame em tabela Markdown com cabeçalhos amigáveis
         dataframe_to_markdown(
-            ranking_autores.rename(
-                columns={
-                    "autor_nome": "Autor",
-                    "score_engajamento": "Score",
-                }
-            ),
+            ranking_autores,
             headers=["Autor", "Score"],
+            columns=["autor_nome", "score_engajamento"],
         ),
         
         "## Interações por Categoria",
-        # Converte DataFrame em tabela Markdown com colunas renomeadas
+        # Converte DataFrame em tabela Markdown com cabeçalhos amigáveis
         dataframe_to_markdown(
-            categorias.rename(
-                columns={
-                    "categoria": "Categoria",
-                    "interacoes": "Interações",
-                    "score": "Score",
-                }
-            ),
+            categorias,
             headers=["Categoria", "Interações", "Score"],
+            columns=["categoria", "interacoes", "score"],
         ),
         
         "## Distribuição dos Tipos de Interação",
-        # Converte DataFrame em tabela Markdown com colunas renomeadas
+        # Converte DataFrame em tabela Markdown com cabeçalhos amigáveis
         dataframe_to_markdown(
-            distribuicao.rename(
-                columns={
-                    "tipo_interacao": "Tipo",
-                    "quantidade": "Qtd",
-                    "percentual": "%",
-                },
-            ),
+            distribuicao,
             headers=["Tipo", "Qtd", "%"],
+            columns=["tipo_interacao", "quantidade", "percentual"],
         ),
     ]
 
-    # Junta todos os blocos separados por duas quebras de linha
-    return "\n\n".join(blocos)
+    # Escreve os blocos em um único buffer, separados por duas quebras de linha
+    buffer = io.StringIO()
+    for indice, bloco in enumerate(blocos):
+        if indice:
+            buffer.write("\n\n")
+        buffer.write(bloco)
+    return buffer.getvalue()
 
 
 def persist_report(content: str, filename: str = "relatorio_engajamento.md") -> Path:
@@ -164,6 +169,8 @@ def persist_report(content: str, filename: str = "relatorio_engajamento.md") ->
     destino = RELATORIOS_DIR / filename
     
     # Salva o conteúdo em UTF-8 para suportar caracteres especiais
-    destino.write_text(content, encoding="utf-8")
+    # (codificado uma única vez e gravado em modo binário, sem a camada de
+    # texto; as quebras de linha ficam "\n" em qualquer sistema)
+    destino.write_bytes(content.encode("utf-8"))
     
     return destino
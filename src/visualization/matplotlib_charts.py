@@ -4,18 +4,36 @@ Funções de visualização utilizando apenas Matplotlib.
 Este módulo contém todas as funções responsáveis por criar gráficos
 e visualizações dos dados de engajamento usando Matplotlib.
 Os gráficos são salvos como arquivos PNG na pasta visualizacoes/.
+
+Como os gráficos só são gravados em arquivo, cada chamada monta sua própria
+``matplotlib.figure.Figure``, sem passar pelo pyplot: nenhum estado global é
+alterado (nem o backend escolhido pelo usuário) e as funções podem ser
+chamadas de várias threads ao mesmo tempo.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 # Diretório onde os gráficos serão salvos
 OUTPUT_DIR = Path(__file__).resolve().parents[2] / "visualizacoes"
 
+# Tamanho (em polegadas) de todos os gráficos
+_FIGSIZE = (6, 4)
+
+# Máximo de pontos desenhados na timeline; séries mais longas são agregadas
+# por semana (ou mês) antes do plot, o que não muda a leitura do gráfico na
+# largura de 720 pixels mas reduz o caminho a rasterizar
+MAX_TIMELINE_POINTS = 1000
+
+# Períodos usados na agregação da timeline, do mais fino ao mais grosso
+_PERIODOS_TIMELINE = (("W", "semanal"), ("MS", "mensal"))
+
 
 def _prepare_output_dir() -> None:
     """
@@ -27,6 +45,54 @@ def _prepare_output_dir() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _nova_figura() -> tuple[Figure, Axes]:
+    """
+    Cria uma figura independente, com um único eixo.
+
+    A ``Figure`` é criada diretamente, fora do gerenciador de figuras do
+    pyplot: não fica registrada globalmente (é liberada pelo coletor de lixo
+    ao fim da chamada) e ``savefig`` usa o canvas Agg para gravar o PNG,
+    qualquer que seja o backend interativo configurado.
+
+    Returns
+    -------
+    tuple[Figure, Axes]
+        Figura nova e seu eixo.
+    """
+
+    fig = Figure(figsize=_FIGSIZE)
+    return fig, fig.add_subplot(111)
+
+
+def _reduzir_timeline(df: pd.DataFrame) -> tuple[pd.DataFrame, str]:
+    """
+    Agrega a timeline diária quando ela tem pontos demais para o gráfico.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame com colunas "data_interacao" e "score" por dia.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, str]
+        Timeline com no máximo ``MAX_TIMELINE_POINTS`` linhas (quando
+        possível) e o nome do período usado ("diária", "semanal" ou
+        "mensal").
+    """
+
+    if len(df) <= MAX_TIMELINE_POINTS:
+        return df, "diária"
+
+    # Soma os scores por período, do mais fino ao mais grosso, até caber
+    serie = df.set_index("data_interacao")["score"]
+    for frequencia, periodo in _PERIODOS_TIMELINE:
+        reduzida = serie.resample(frequencia).sum().reset_index()
+        if len(reduzida) <= MAX_TIMELINE_POINTS:
+            break
+    return reduzida, periodo
+
+
 def plot_interacoes_por_categoria(df: pd.DataFrame) -> Path:
     """
     Gera um gráfico de barras simples mostrando o score por categoria.
@@ -48,8 +114,8 @@ def plot_interacoes_por_categoria(df: pd.DataFrame) -> Path:
     # Garante que o diretório de saída existe
     _prepare_output_dir()
     
-    # Cria figura e eixos com tamanho padrão
-    fig, ax = plt.subplots(figsize=(6, 4))
+    # Cria uma figura própria com tamanho padrão
+    fig, ax = _nova_figura()
     
     # Cria gráfico de barras com cor azul padrão
     ax.bar(df["categoria"], df["score"], color="#4C72B0")
@@ -59,11 +125,14 @@ def plot_interacoes_por_categoria(df: pd.DataFrame) -> Path:
     ax.set_ylabel("Score de Engajamento")
     ax.set_title("Score por Categoria")
     
-    # Rotaciona labels do eixo X para melhor legibilidade
-    plt.xticks(rotation=20, ha="right")
+    # Rotaciona labels do eixo X para melhor legibilidade (direto no eixo,
+    # sem passar pelo estado global do pyplot)
+    ax.tick_params(axis="x", rotation=20)
+    for label in ax.get_xticklabels():
+        label.set_ha("right")
     
     # Ajusta layout para evitar cortes
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Define caminho do arquivo de saída
     output = OUTPUT_DIR / "score_por_categoria.png"
@@ -71,9 +140,6 @@ def plot_interacoes_por_categoria(df: pd.DataFrame) -> Path:
     # Salva o gráfico em PNG com resolução adequada
     fig.savefig(output, dpi=120)
     
-    # Fecha a figura para liberar memória
-    plt.close(fig)
-    
     return output
 
 
@@ -83,6 +149,8 @@ def plot_timeline_engajamento(df: pd.DataFrame) -> Path:
     
     Este gráfico de linha mostra como o engajamento evolui ao longo do tempo,
     permitindo identificar tendências, picos e quedas no engajamento diário.
+    Séries com mais de ``MAX_TIMELINE_POINTS`` dias são somadas por semana
+    (ou por mês) antes do desenho.
     
     Parameters
     ----------
@@ -99,8 +167,11 @@ def plot_timeline_engajamento(df: pd.DataFrame) -> Path:
     # Garante que o diretório de saída existe
     _prepare_output_dir()
     
-    # Cria figura e eixos com tamanho padrão
-    fig, ax = plt.subplots(figsize=(6, 4))
+    # Limita a quantidade de pontos em períodos longos
+    df, periodo = _reduzir_timeline(df)
+
+    # Cria uma figura própria com tamanho padrão
+    fig, ax = _nova_figura()
     
     # Cria gráfico de linha com marcadores circulares e cor verde
     ax.plot(df["data_interacao"], df["score"], marker="o", color="#55A868")
@@ -108,24 +179,23 @@ def plot_timeline_engajamento(df: pd.DataFrame) -> Path:
     # Configura labels e título
     ax.set_xlabel("Data")
     ax.set_ylabel("Score de Engajamento")
-    ax.set_title("Evolução diária do engajamento")
+    ax.set_title(f"Evolução {periodo} do engajamento")
     
     # Adiciona grade sutil para facilitar leitura
     ax.grid(alpha=0.3)
     
+    # Datas compactas no eixo X (sem rotacionar labels nem refazer o layout)
+    ax.xaxis.set_major_formatter(
+        mdates.ConciseDateFormatter(ax.xaxis.get_major_locator())
+    )
+    
     # Ajusta layout para evitar cortes
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Define caminho do arquivo de saída
     output = OUTPUT_DIR / "timeline_engajamento.png"
     
-    # Formata automaticamente as datas no eixo X para melhor legibilidade
-    fig.autofmt_xdate()
-    
     # Salva o gráfico em PNG com resolução adequada
     fig.savefig(output, dpi=120)
     
-    # Fecha a figura para liberar memória
-    plt.close(fig)
-    
     return output
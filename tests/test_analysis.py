@@ -2,24 +2,32 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from src.analysis import engajamento
+from src.data.preprocessing import INTERACTION_WEIGHTS
 
 
 def _sample_df() -> pd.DataFrame:
+    # Mesmos dtypes entregues pela ingestão e pelo preprocessamento
+    ids = "int32[pyarrow]"
     data = {
-        "interacao_id": [1, 2, 3],
-        "conteudo_id": [101, 101, 102],
-        "usuario_id": [1, 2, 3],
-        "autor_id": [10, 10, 11],
-        "autor_nome": ["Ana", "Ana", "Bruno"],
-        "peso_interacao": [1, 2, 3],
-        "categoria": ["video", "video", "texto"],
-        "data_interacao": pd.to_datetime(
-            ["2025-10-01", "2025-10-01", "2025-10-02"]
+        "interacao_id": pd.array([1, 2, 3], dtype=ids),
+        "conteudo_id": pd.array([101, 101, 102], dtype=ids),
+        "usuario_id": pd.array([1, 2, 3], dtype=ids),
+        "autor_id": pd.array([10, 10, 11], dtype=ids),
+        "autor_nome": pd.Categorical(["Ana", "Ana", "Bruno"]),
+        "peso_interacao": np.array([1, 2, 3], dtype=np.int8),
+        "categoria": pd.Categorical(["video", "video", "texto"]),
+        "data_interacao": np.array(
+            ["2025-10-01", "2025-10-01", "2025-10-02"], dtype="datetime64[ns]"
+        ),
+        "tipo_interacao": pd.Categorical(
+            ["curtida", "comentario", "compartilhamento"],
+            categories=list(INTERACTION_WEIGHTS),
         ),
-        "tipo_interacao": ["curtida", "comentario", "compartilhamento"],
     }
     return pd.DataFrame(data)
 
@@ -38,3 +46,114 @@ def test_top_autores_por_engajamento():
     assert ranking.iloc[0]["autor_nome"] == "Ana"
     assert ranking.iloc[0]["score_engajamento"] == 3
 
+
+def test_top_autores_empate_fica_com_menor_autor_id():
+    # Bruno (11) aparece primeiro, mas empata com Ana (10)
+    df = _sample_df().iloc[::-1].reset_index(drop=True)
+    ranking = engajamento.top_autores_por_engajamento(df, top_n=2)
+    assert ranking["autor_id"].tolist() == [10, 11]
+    assert ranking["autor_nome"].tolist() == ["Ana", "Bruno"]
+    stream = engajamento.stream_engagement_metrics([df.iloc[:1], df.iloc[1:]])
+    assert stream["ranking"]["autor_id"].tolist()[:2] == [10, 11]
+
+
+def test_timeline_engajamento_preenche_dias_sem_interacao():
+    df = _sample_df()
+    df.loc[2, "data_interacao"] = pd.Timestamp("2025-10-03")
+    timeline = engajamento.timeline_engajamento(df.iloc[::-1])
+    assert timeline["interacoes"].tolist() == [2, 0, 1]
+    assert timeline["score"].tolist() == [3, 0, 3]
+
+
+def test_timeline_engajamento_ignora_datas_ausentes():
+    df = _sample_df()
+    df.loc[0, "data_interacao"] = pd.NaT
+    timeline = engajamento.timeline_engajamento(df)
+    assert timeline["interacoes"].tolist() == [1, 1]
+    assert timeline["score"].tolist() == [2, 3]
+    stream = engajamento.stream_engagement_metrics([df.iloc[:1], df.iloc[1:]])
+    pd.testing.assert_frame_equal(stream["timeline"], timeline)
+
+    df["data_interacao"] = pd.NaT
+    assert engajamento.timeline_engajamento(df).empty
+    assert engajamento.stream_engagement_metrics([df])["timeline"].empty
+
+
+def test_timeline_polars_ignora_datas_ausentes():
+    pl = pytest.importorskip("polars")
+    from src.analysis import engajamento_polars
+
+    df = _sample_df()
+    df.loc[0, "data_interacao"] = pd.NaT
+    timeline = engajamento_polars.timeline_engajamento(pl.from_pandas(df).lazy())
+    assert timeline.collect()["interacoes"].to_list() == [1, 1]
+
+    df["data_interacao"] = pd.NaT
+    timeline = engajamento_polars.timeline_engajamento(pl.from_pandas(df).lazy())
+    assert timeline.collect().is_empty()
+
+
+def test_distribuicao_tipo_interacao():
+    df = _sample_df()
+    df["tipo_interacao"] = pd.Categorical(
+        ["curtida", "curtida", "comentario"],
+        categories=["curtida", "comentario", "compartilhamento"],
+    )
+    distribuicao = engajamento.distribuicao_tipo_interacao(df)
+    assert distribuicao["tipo_interacao"].tolist() == ["curtida", "comentario"]
+    assert distribuicao["quantidade"].tolist() == [2, 1]
+    assert distribuicao["percentual"].tolist() == [66.67, 33.33]
+
+
+def test_metricas_polars_equivalentes_ao_pandas():
+    pl = pytest.importorskip("polars")
+    from src.analysis import engajamento_polars
+
+    df = _sample_df()
+    metricas = engajamento_polars.calcular_metricas_polars(pl.from_pandas(df).lazy())
+    assert metricas["globais"] == engajamento.global_engagement_metrics(df)
+    ranking = engajamento.top_autores_por_engajamento(df)
+    assert metricas["ranking"]["autor_nome"].tolist() == ranking["autor_nome"].tolist()
+    timeline = engajamento.timeline_engajamento(df)
+    assert metricas["timeline"]["score"].tolist() == timeline["score"].tolist()
+
+
+def test_stream_engagement_metrics_equivale_ao_dataset_completo():
+    df = _sample_df()
+    blocos = (df.iloc[i : i + 2] for i in range(0, len(df), 2))
+    metricas = engajamento.stream_engagement_metrics(blocos)
+    assert metricas["globais"] == engajamento.global_engagement_metrics(df)
+    pd.testing.assert_frame_equal(
+        metricas["timeline"], engajamento.timeline_engajamento(df)
+    )
+    assert metricas["ranking"]["score_engajamento"].tolist() == [3, 3]
+
+
+def test_global_engagement_metrics_com_tipo_texto():
+    df = _sample_df()
+    df["tipo_interacao"] = df["tipo_interacao"].astype(object)
+    metrics = engajamento.global_engagement_metrics(df)
+    assert metrics["engajamento_medio_por_conteudo"] == 3.0
+
+
+def test_global_engagement_metrics_ignora_ids_nulos():
+    df = _sample_df()
+    df["interacao_id"] = pd.array([1, None, 1], dtype="int32[pyarrow]")
+    metrics = engajamento.global_engagement_metrics(df)
+    assert metrics["total_interacoes"] == df["interacao_id"].nunique() == 1
+
+
+def test_stream_engagement_metrics_sem_blocos_devolve_metricas_vazias():
+    metricas = engajamento.stream_engagement_metrics([])
+    vazias = engajamento.metricas_vazias()
+    assert metricas["globais"] == vazias["globais"]
+    pd.testing.assert_frame_equal(metricas["timeline"], vazias["timeline"])
+
+
+def test_global_engagement_metrics_com_categorias_em_outra_ordem():
+    df = _sample_df()
+    df["tipo_interacao"] = df["tipo_interacao"].cat.reorder_categories(
+        ["compartilhamento", "curtida", "comentario"]
+    )
+    metrics = engajamento.global_engagement_metrics(df)
+    assert metrics["engajamento_medio_por_conteudo"] == 3.0
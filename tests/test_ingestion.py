@@ -0,0 +1,168 @@
+"""Testes simples para a camada de ingestão."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.data import ingestion
+
+
+def _write_interacoes(base_dir) -> None:
+    (base_dir / "interacoes.csv").write_text(
+        "interacao_id,conteudo_id,usuario_id,tipo_interacao,data_interacao\n"
+        "1,101,2,curtida,2025-10-01 12:10:00\n"
+        "2,102,3,comentario,2025-10-02 08:00:00\n",
+        encoding="utf-8",
+    )
+
+
+def test_load_csv_dataset_aplica_tipos(tmp_path):
+    _write_interacoes(tmp_path)
+    df = ingestion.load_csv_dataset(
+        ingestion.DATASETS["interacoes"], base_dir=tmp_path
+    )
+    assert len(df) == 2
+    assert df["interacao_id"].dtype == pd.ArrowDtype(pa.int32())
+    assert pd.api.types.is_datetime64_dtype(df["data_interacao"])
+
+
+def test_load_csv_dataset_data_invalida_vira_nat(tmp_path):
+    (tmp_path / "interacoes.csv").write_text(
+        "interacao_id,conteudo_id,usuario_id,tipo_interacao,data_interacao\n"
+        "1,101,2,curtida,2025-10-01 12:10:00\n"
+        "2,102,3,comentario,not-a-date\n",
+        encoding="utf-8",
+    )
+    df = ingestion.load_csv_dataset(
+        ingestion.DATASETS["interacoes"], base_dir=tmp_path, use_cache=False
+    )
+    assert len(df) == 2
+    assert df["data_interacao"].isna().tolist() == [False, True]
+
+
+def test_load_csv_dataset_datas_em_formatos_mistos(tmp_path):
+    (tmp_path / "conteudos.csv").write_text(
+        "conteudo_id,autor_id,categoria,data_publicacao\n"
+        "101,1,video,2025-10-01\n"
+        "102,2,texto,2025-10-01 10:00:00\n",
+        encoding="utf-8",
+    )
+    df = ingestion.load_csv_dataset(
+        ingestion.DATASETS["conteudos"], base_dir=tmp_path, use_cache=False
+    )
+    assert df["data_publicacao"].tolist() == [
+        pd.Timestamp("2025-10-01"),
+        pd.Timestamp("2025-10-01 10:00:00"),
+    ]
+
+
+def test_load_csv_dataset_datas_iso8601(tmp_path):
+    (tmp_path / "interacoes.csv").write_text(
+        "interacao_id,conteudo_id,usuario_id,tipo_interacao,data_interacao\n"
+        "1,101,2,curtida,2025-10-01 12:10:00\n"
+        "2,102,3,comentario,2025-10-01T12:10:00\n"
+        "3,101,4,curtida,2025-10-02 08:00:00.250\n"
+        "4,102,5,compartilhamento,2025-10-02T08:00:00.250Z\n"
+        "5,101,6,curtida,2025-10-03 08:00\n"
+        "6,102,7,curtida,not-a-date\n",
+        encoding="utf-8",
+    )
+    df = ingestion.load_csv_dataset(
+        ingestion.DATASETS["interacoes"], base_dir=tmp_path, use_cache=False
+    )
+    assert df["data_interacao"].tolist()[:5] == [
+        pd.Timestamp("2025-10-01 12:10:00"),
+        pd.Timestamp("2025-10-01 12:10:00"),
+        pd.Timestamp("2025-10-02 08:00:00.250"),
+        pd.Timestamp("2025-10-02 08:00:00.250"),
+        pd.Timestamp("2025-10-03 08:00"),
+    ]
+    assert pd.isna(df["data_interacao"].iloc[5])
+
+
+def test_load_csv_dataset_arquivo_inexistente(tmp_path):
+    with pytest.raises(ingestion.DataIngestionError):
+        ingestion.load_csv_dataset(ingestion.DATASETS["usuarios"], base_dir=tmp_path)
+
+
+def test_load_csv_dataset_reaproveita_cache_parquet(tmp_path):
+    config = ingestion.DATASETS["interacoes"]
+    _write_interacoes(tmp_path)
+    original = ingestion.load_csv_dataset(config, base_dir=tmp_path)
+
+    cache_files = list((tmp_path / ingestion.CACHE_DIRNAME).glob("*.parquet"))
+    assert len(cache_files) == 1
+
+    cached = ingestion.load_csv_dataset(config, base_dir=tmp_path)
+    pd.testing.assert_frame_equal(original, cached)
+
+    # Alterar o CSV invalida a chave e remove a cópia antiga
+    with (tmp_path / "interacoes.csv").open("a", encoding="utf-8") as fh:
+        fh.write("3,101,4,compartilhamento,2025-10-03 09:30:00\n")
+    atualizado = ingestion.load_csv_dataset(config, base_dir=tmp_path)
+    assert len(atualizado) == 3
+    assert list((tmp_path / ingestion.CACHE_DIRNAME).glob("*.parquet")) != cache_files
+    assert len(list((tmp_path / ingestion.CACHE_DIRNAME).glob("*.parquet"))) == 1
+
+
+def test_load_csv_dataset_descarta_cache_corrompido(tmp_path):
+    config = ingestion.DATASETS["interacoes"]
+    _write_interacoes(tmp_path)
+    original = ingestion.load_csv_dataset(config, base_dir=tmp_path)
+
+    (cache_file,) = (tmp_path / ingestion.CACHE_DIRNAME).glob("*.parquet")
+    # Nenhum temporário da escrita atômica fica para trás
+    assert not list(cache_file.parent.glob("*.tmp"))
+    cache_file.write_bytes(cache_file.read_bytes()[:20])
+
+    relido = ingestion.load_csv_dataset(config, base_dir=tmp_path)
+    pd.testing.assert_frame_equal(original, relido)
+    # A cópia corrompida é substituída por uma nova, legível
+    pd.testing.assert_frame_equal(
+        original, ingestion.load_csv_dataset(config, base_dir=tmp_path)
+    )
+
+
+def test_load_csv_dataset_ignora_colunas_nao_declaradas(tmp_path):
+    (tmp_path / "usuarios.csv").write_text(
+        "usuario_id,nome,segmento,observacao\n1,Ana,creator,qualquer texto\n",
+        encoding="utf-8",
+    )
+    df = ingestion.load_csv_dataset(
+        ingestion.DATASETS["usuarios"], base_dir=tmp_path, use_cache=False
+    )
+    assert list(df.columns) == ["usuario_id", "nome", "segmento"]
+
+
+def test_load_all_datasets_memoriza_ate_csv_mudar(tmp_path):
+    (tmp_path / "usuarios.csv").write_text(
+        "usuario_id,nome,segmento\n1,Ana,creator\n", encoding="utf-8"
+    )
+    (tmp_path / "conteudos.csv").write_text(
+        "conteudo_id,autor_id,categoria,data_publicacao\n101,1,video,2025-10-01\n",
+        encoding="utf-8",
+    )
+    _write_interacoes(tmp_path)
+    ingestion.load_all_datasets.cache_clear()
+
+    primeiro = ingestion.load_all_datasets(tmp_path, use_cache=False)
+    primeiro["usuarios"]["extra"] = 1
+    segundo = ingestion.load_all_datasets(tmp_path, use_cache=False)
+    assert "extra" not in segundo["usuarios"].columns
+
+    with (tmp_path / "usuarios.csv").open("a", encoding="utf-8") as fh:
+        fh.write("2,Bruno,brand\n")
+    terceiro = ingestion.load_all_datasets(tmp_path, use_cache=False)
+    assert len(terceiro["usuarios"]) == 2
+    ingestion.load_all_datasets.cache_clear()
+
+
+def test_load_csv_dataset_em_blocos(tmp_path):
+    _write_interacoes(tmp_path)
+    config = ingestion.DATASETS["interacoes"]
+    blocos = list(ingestion.load_csv_dataset(config, base_dir=tmp_path, chunksize=1))
+    assert [len(bloco) for bloco in blocos] == [1, 1]
+    completo = ingestion.load_csv_dataset(config, base_dir=tmp_path, use_cache=False)
+    pd.testing.assert_frame_equal(pd.concat(blocos, ignore_index=True), completo)
@@ -0,0 +1,113 @@
+"""Testes simples para o cache de métricas do pipeline."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+import main
+
+
+def _metricas() -> dict:
+    return {
+        "globais": {"total_interacoes": 3, "engajamento_medio_por_conteudo": 1.5},
+        "ranking": pd.DataFrame({"autor_id": [10, 11], "score_engajamento": [3, 2]}),
+        "categorias": pd.DataFrame({"categoria": ["video"], "score": [5]}),
+        "timeline": pd.DataFrame({"interacoes": [1, 2], "score": [2, 3]}),
+        "distribuicao": pd.DataFrame({"tipo_interacao": ["curtida"], "percentual": [1.0]}),
+    }
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    # Cache isolado e memória do processo limpa a cada teste
+    monkeypatch.setattr(main, "METRICAS_CACHE_DIR", tmp_path / "cache")
+    main._carregar_metricas.cache_clear()
+    yield tmp_path / "cache"
+    main._carregar_metricas.cache_clear()
+
+
+@pytest.fixture
+def calculos(monkeypatch) -> list:
+    chamadas = []
+
+    def _calcular(engajamento_df):
+        chamadas.append(engajamento_df)
+        return _metricas()
+
+    monkeypatch.setattr(main, "calcular_metricas_engajamento", _calcular)
+    return chamadas
+
+
+def _dataset(tmp_path):
+    caminho = tmp_path / "engajamento.parquet"
+    caminho.write_bytes(b"dados")
+    return caminho
+
+
+def test_obter_metricas_calcula_uma_vez_e_reaproveita(cache_dir, calculos, tmp_path):
+    caminho = _dataset(tmp_path)
+    primeira = main.obter_metricas(None, caminho)
+    main._carregar_metricas.cache_clear()
+    segunda = main.obter_metricas(None, caminho)
+
+    assert len(calculos) == 1
+    assert segunda["globais"] == primeira["globais"]
+    pd.testing.assert_frame_equal(segunda["ranking"], primeira["ranking"])
+
+    # Dataset processado intacto: o pipeline pode pular todas as etapas
+    metricas, reaproveitado = main._metricas_reaproveitaveis("pandas")
+    assert reaproveitado == caminho
+    assert metricas["globais"] == primeira["globais"]
+
+
+def test_metricas_reaproveitaveis_exige_dataset_intacto(cache_dir, calculos, tmp_path):
+    caminho = _dataset(tmp_path)
+    main.obter_metricas(None, caminho)
+
+    caminho.write_bytes(b"dados alterados")
+    assert main._metricas_reaproveitaveis("pandas") is None
+    assert main._metricas_reaproveitaveis("polars") is None
+
+
+def test_obter_metricas_sem_cache_nao_grava(cache_dir, calculos, tmp_path):
+    main.obter_metricas(None, _dataset(tmp_path), usar_cache=False)
+    main.obter_metricas(None, _dataset(tmp_path), usar_cache=False)
+    assert len(calculos) == 2
+    assert not cache_dir.exists()
+
+
+def test_carregar_metricas_chave_ausente(cache_dir):
+    with pytest.raises(FileNotFoundError):
+        main._carregar_metricas("pandas_inexistente")
+
+
+def test_carregar_metricas_entrada_corrompida_e_recalculada(
+    cache_dir, calculos, tmp_path
+):
+    caminho = _dataset(tmp_path)
+    main.obter_metricas(None, caminho)
+    chave = main._chave_metricas("pandas")
+    (cache_dir / f"metricas_{chave}" / "ranking.parquet").write_bytes(b"lixo")
+    main._carregar_metricas.cache_clear()
+
+    with pytest.raises(FileNotFoundError):
+        main._carregar_metricas(chave)
+    assert main._metricas_reaproveitaveis("pandas") is None
+
+    # A entrada corrompida é substituída por uma nova, legível
+    main.obter_metricas(None, caminho)
+    assert len(calculos) == 2
+    main._carregar_metricas.cache_clear()
+    assert main._carregar_metricas(chave)["globais"] == _metricas()["globais"]
+
+
+def test_salvar_metricas_mantem_entradas_de_outro_backend(cache_dir):
+    main._salvar_metricas("pandas_antiga", _metricas())
+    main._salvar_metricas("polars_atual", _metricas())
+    main._salvar_metricas("pandas_atual", _metricas())
+    (cache_dir / "metricas_formato_anterior.pkl").write_bytes(b"pickle")
+    main._salvar_metricas("pandas_nova", _metricas())
+
+    entradas = sorted(p.name for p in cache_dir.iterdir())
+    assert entradas == ["metricas_pandas_nova", "metricas_polars_atual"]
@@ -0,0 +1,188 @@
+"""Testes simples para a camada de preprocessamento."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.data import preprocessing
+
+
+def _raw_datasets() -> dict:
+    usuarios = pd.DataFrame(
+        {
+            "usuario_id": [1, 2, 3, 3],
+            "nome": [" Ana ", "Bruno", "Carla", "Carla"],
+            "segmento": ["Creator ", "brand", "creator", "creator"],
+        }
+    )
+    conteudos = pd.DataFrame(
+        {
+            "conteudo_id": [101, 102],
+            "autor_id": [1, 3],
+            "categoria": [" Video", "texto"],
+            "data_publicacao": ["2025-10-01", "2025-10-02"],
+        }
+    )
+    interacoes = pd.DataFrame(
+        {
+            "interacao_id": [1, 2, 3, 4],
+            "conteudo_id": [101, 101, 102, 102],
+            "usuario_id": [2, 3, 1, 2],
+            "tipo_interacao": ["Curtida", "comentario", "compartilhamento", "spam"],
+            "data_interacao": [
+                "2025-10-01 12:10:00",
+                "2025-10-01 13:00:00",
+                "2025-10-02 09:00:00",
+                "2025-10-02 10:00:00",
+            ],
+        }
+    )
+    return {"usuarios": usuarios, "conteudos": conteudos, "interacoes": interacoes}
+
+
+def test_build_engagement_dataset():
+    dataset = preprocessing.build_engagement_dataset(_raw_datasets())
+    # A interação "spam" é descartada por não ter peso conhecido
+    assert dataset["interacao_id"].tolist() == [1, 2, 3]
+    assert dataset["peso_interacao"].tolist() == [1, 2, 3]
+    assert dataset["peso_interacao"].dtype == "int8"
+    assert dataset["dia_interacao"].dtype == "datetime64[ns]"
+    assert dataset["autor_nome"].tolist() == ["Ana", "Ana", "Carla"]
+    assert dataset["categoria"].tolist() == ["video", "video", "texto"]
+    for coluna in preprocessing.CATEGORICAL_COLUMNS:
+        assert isinstance(dataset[coluna].dtype, pd.CategoricalDtype)
+
+
+def test_build_engagement_dataset_com_colunas_arrow():
+    # A ingestão entrega texto em Arrow; o resultado deve ser o mesmo
+    datasets = {
+        nome: df.convert_dtypes(dtype_backend="pyarrow")
+        for nome, df in _raw_datasets().items()
+    }
+    dataset = preprocessing.build_engagement_dataset(datasets)
+    assert dataset["autor_nome"].tolist() == ["Ana", "Ana", "Carla"]
+    assert dataset["categoria"].tolist() == ["video", "video", "texto"]
+    assert dataset["tipo_interacao"].tolist() == [
+        "curtida",
+        "comentario",
+        "compartilhamento",
+    ]
+
+
+def test_blocos_compartilham_categorias():
+    datasets = _raw_datasets()
+    interacoes = datasets["interacoes"]
+    blocos = [
+        preprocessing.build_engagement_dataset(
+            {**datasets, "interacoes": interacoes.iloc[inicio : inicio + 2]}
+        )
+        for inicio in (0, 2)
+    ]
+    for coluna in preprocessing.CATEGORICAL_COLUMNS:
+        assert blocos[0][coluna].dtype == blocos[1][coluna].dtype
+
+
+def test_build_engagement_dataset_polars_equivale_ao_pandas():
+    pytest.importorskip("polars")
+    from src.data import preprocessing_polars
+
+    esperado = preprocessing.build_engagement_dataset(_raw_datasets())
+    obtido = preprocessing_polars.build_engagement_dataset_polars(_raw_datasets())
+    assert list(obtido.columns) == list(esperado.columns)
+    for coluna in ("interacao_id", "peso_interacao", "autor_nome", "categoria"):
+        assert obtido[coluna].tolist() == esperado[coluna].tolist()
+    assert obtido["tipo_interacao"].dtype == esperado["tipo_interacao"].dtype
+
+
+def test_persist_dataset_parquet_preserva_tipos(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "PROCESSED_DIR", tmp_path)
+    dataset = preprocessing.build_engagement_dataset(_raw_datasets())
+    caminho = preprocessing.persist_dataset(dataset)
+    assert caminho == tmp_path / "engajamento.parquet"
+    relido = pd.read_parquet(caminho)
+    assert isinstance(relido["categoria"].dtype, pd.CategoricalDtype)
+    assert relido["interacao_id"].tolist() == [1, 2, 3]
+    with pytest.raises(ValueError):
+        preprocessing.persist_dataset(dataset, append=True)
+
+
+def test_persist_dataset_deduz_formato_da_extensao(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "PROCESSED_DIR", tmp_path)
+    dataset = preprocessing.build_engagement_dataset(_raw_datasets())
+    caminho = preprocessing.persist_dataset(dataset, "saida.csv")
+    assert caminho.read_text(encoding="utf-8").startswith("interacao_id,")
+    with pytest.raises(ValueError):
+        preprocessing.persist_dataset(dataset, "saida.csv", formato="parquet")
+    with pytest.raises(ValueError):
+        preprocessing.persist_dataset(dataset, "saida.txt")
+
+
+def test_persist_dataset_polars_grava_parquet_como_pandas(tmp_path, monkeypatch):
+    pytest.importorskip("polars")
+    from src.data import preprocessing_polars
+
+    monkeypatch.setattr(preprocessing_polars, "PROCESSED_DIR", tmp_path)
+    lf = preprocessing_polars.build_engagement_lazyframe(_raw_datasets())
+    caminho = preprocessing_polars.persist_dataset_polars(lf.collect())
+    assert caminho == tmp_path / "engajamento.parquet"
+    relido = pd.read_parquet(caminho)
+    esperado = preprocessing.build_engagement_dataset(_raw_datasets())
+    assert list(relido.columns) == list(esperado.columns)
+    for coluna in preprocessing.CATEGORICAL_COLUMNS:
+        assert relido[coluna].tolist() == esperado[coluna].tolist()
+        assert isinstance(relido[coluna].dtype, pd.CategoricalDtype)
+
+
+def test_build_engagement_dataset_em_lotes_equivale_ao_lote_unico():
+    esperado = preprocessing.build_engagement_dataset(_raw_datasets())
+    obtido = preprocessing.build_engagement_dataset(_raw_datasets(), n_batches=3)
+    pd.testing.assert_frame_equal(obtido, esperado)
+    with pytest.raises(ValueError):
+        preprocessing.build_engagement_dataset(_raw_datasets(), n_batches=0)
+
+
+@pytest.mark.parametrize("n_batches", [1, 2])
+def test_build_engagement_dataset_rejeita_conteudo_repetido(n_batches):
+    datasets = _raw_datasets()
+    datasets["conteudos"] = pd.concat([datasets["conteudos"]] * 2, ignore_index=True)
+    with pytest.raises(pd.errors.MergeError):
+        preprocessing.build_engagement_dataset(datasets, n_batches=n_batches)
+
+
+def test_clean_usuarios_converte_ids_em_texto():
+    usuarios = _raw_datasets()["usuarios"].astype({"usuario_id": str})
+    limpos = preprocessing.clean_usuarios(usuarios)
+    assert limpos["usuario_id"].dtype == "int64"
+    assert limpos["usuario_id"].tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [object, "string[pyarrow]", pd.ArrowDtype(pa.large_string())],
+    ids=["object", "string_pyarrow", "large_string"],
+)
+def test_normalize_str_series_usa_kernels_arrow(dtype, monkeypatch):
+    convertidas = []
+    original = preprocessing._as_arrow_strings
+
+    def espiao(serie):
+        convertidas.append(original(serie))
+        return convertidas[-1]
+
+    monkeypatch.setattr(preprocessing, "_as_arrow_strings", espiao)
+    serie = pd.Series(["  Vídeo ", "ÁUDIO", None], dtype=dtype)
+    normalizada = preprocessing._normalize_str_series(serie)
+
+    # O texto passou pelos kernels do pyarrow.compute, não pelo .str do pandas
+    assert convertidas[0] is not None
+    assert normalizada.dtype == pd.ArrowDtype(pa.string())
+    assert normalizada.tolist()[:2] == ["vídeo", "áudio"]
+    assert normalizada.isna().tolist() == [False, False, True]
+
+
+def test_normalize_str_series_valores_nao_texto_mesmo_dtype():
+    normalizada = preprocessing._normalize_str_series(pd.Series([" A ", 1]))
+    assert normalizada.dtype == pd.ArrowDtype(pa.string())
+    assert normalizada.tolist() == ["a", "1"]